@@ -16,18 +16,20 @@ if readme_file.exists():
 requirements_file = Path(__file__).parent / "requirements.txt"
 requirements = []
 if requirements_file.exists():
-    with open(requirements_file, 'r', encoding='utf-8') as f:
-        requirements = [
-            line.strip() for line in f
-            if line.strip() and not line.startswith('#')
-        ]
+    requirements = [
+        line for line in (
+            raw.strip() for raw in requirements_file.read_text(encoding='utf-8').splitlines()
+        )
+        if line and not line.startswith('#')
+    ]
 
 # Version
 version_file = Path(__file__).parent / "speechbridge" / "__version__.py"
 version = "1.0.0"
 if version_file.exists():
-    exec(version_file.read_text())
-    version = locals().get('__version__', '1.0.0')
+    version_info = {}
+    exec(version_file.read_text(encoding='utf-8'), version_info)
+    version = version_info.get('__version__', '1.0.0')
 
 setup(
     name="speechbridge",
@@ -6,6 +6,7 @@ Main command-line interface entry point.
 """
 
 import click
+import logging
 import sys
 from pathlib import Path
 from typing import Optional
@@ -18,7 +19,7 @@ from ..__version__ import __version__
 @click.group()
 @click.version_option(version=__version__, prog_name='SpeechBridge')
 @click.option('--log-dir', default='logs', help='Log directory')
-@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output (debug-level log files)')
 @click.pass_context
 def cli(ctx, log_dir, verbose):
     """
@@ -30,6 +31,7 @@ def cli(ctx, log_dir, verbose):
     ctx.ensure_object(dict)
     ctx.obj['logger_system'] = setup_logging(
         log_dir=log_dir,
+        log_level=logging.DEBUG if verbose else logging.INFO,
         console_output=True  # Always show logs in CLI
     )
     ctx.obj['logger'] = ctx.obj['logger_system'].get_logger('cli')
@@ -41,6 +43,8 @@ def cli(ctx, log_dir, verbose):
 @click.argument('output_path', type=click.Path())
 @click.option('--model', '-m', default='base',
               help='Whisper model: tiny, base, small, medium, large')
+@click.option('--engine', type=click.Choice(['whisper', 'faster-whisper']), default='whisper',
+              help='Speech recognition backend (default: whisper)')
 @click.option('--source-lang', '-s', default='auto',
               help='Source language (auto-detect if not specified)')
 @click.option('--target-lang', '-t', default='en',
@@ -68,7 +72,7 @@ def cli(ctx, log_dir, verbose):
 @click.option('--keep-temp', is_flag=True,
               help='Keep temporary files')
 @click.pass_context
-def translate(ctx, video_path, output_path, model, source_lang, target_lang,
+def translate(ctx, video_path, output_path, model, engine, source_lang, target_lang,
               deepl_key, voice, rate, sync, subtitles, subtitle_format,
               subtitle_only, embed_subtitles, export_text, temp_dir, keep_temp):
     """
@@ -86,7 +90,7 @@ def translate(ctx, video_path, output_path, model, source_lang, target_lang,
         click.echo(f"{'='*60}")
         click.echo(f"Input:  {video_path}")
         click.echo(f"Output: {output_path}")
-        click.echo(f"Model:  {model}")
+        click.echo(f"Model:  {model} ({engine})")
         click.echo(f"Source: {source_lang}")
         click.echo(f"Target: {target_lang}")
         click.echo(f"{'='*60}\n")
@@ -97,8 +101,13 @@ def translate(ctx, video_path, output_path, model, source_lang, target_lang,
 
         # Build pipeline
         logger.info("Building pipeline...")
-        builder = (PipelineBuilder()
-                   .with_whisper(model=model, language=source_lang)
+        builder = PipelineBuilder()
+        if engine == 'faster-whisper':
+            builder.with_faster_whisper(model=model, language=source_lang)
+        else:
+            builder.with_whisper(model=model, language=source_lang)
+
+        builder = (builder
                    .with_deepl(api_key=deepl_key, target_lang=target_lang)
                    .with_edge_tts(rate=rate)
                    .with_ffmpeg()
@@ -219,6 +228,8 @@ def translate(ctx, video_path, output_path, model, source_lang, target_lang,
 @click.argument('output_dir', type=click.Path())
 @click.option('--model', '-m', default='base',
               help='Whisper model')
+@click.option('--engine', type=click.Choice(['whisper', 'faster-whisper']), default='whisper',
+              help='Speech recognition backend (default: whisper)')
 @click.option('--target-lang', '-t', default='en',
               help='Target language')
 @click.option('--deepl-key', envvar='DEEPL_API_KEY',
@@ -226,7 +237,7 @@ def translate(ctx, video_path, output_path, model, source_lang, target_lang,
 @click.option('--pattern', default='*.mp4',
               help='File pattern (default: *.mp4)')
 @click.pass_context
-def batch(ctx, video_dir, output_dir, model, target_lang, deepl_key, pattern):
+def batch(ctx, video_dir, output_dir, model, engine, target_lang, deepl_key, pattern):
     """
     Translate multiple videos in batch.
 
@@ -249,6 +260,7 @@ def batch(ctx, video_dir, output_dir, model, target_lang, deepl_key, pattern):
         # Build pipeline
         pipeline = create_pipeline(
             speech_model=model,
+            speech_engine=engine,
             target_language=target_lang,
             deepl_api_key=deepl_key
         )
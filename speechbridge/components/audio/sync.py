@@ -5,14 +5,46 @@ Audio Synchronization
 Synchronize translated audio with original speech timing.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
 import logging
+import re
 import subprocess
 import tempfile
-from datetime import datetime
+import threading
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor
 
 from speechbridge.core.exceptions import ComponentException
+from speechbridge.utils.audio import (
+    SILENCE_THRESHOLD_DB,
+    MIN_SILENCE_DURATION,
+    SILENCEDETECT_FILTER,
+    leading_silence_end
+)
+
+
+# Timeline audio format (pcm_s16le stereo 44.1 kHz)
+SAMPLE_RATE = 44100
+CHANNELS = 2
+SAMPLE_WIDTH = 2
+
+# ffmpeg output options for timeline segments (built once, reused per segment)
+PCM_OUTPUT_ARGS = ('-ac', str(CHANNELS), '-ar', str(SAMPLE_RATE), '-c:a', 'pcm_s16le')
+RESAMPLE_FILTER = f'aresample={SAMPLE_RATE}'
+
+# One second of timeline-format silence, shared by every silence gap
+SILENCE_BLOCK = memoryview(bytes(SAMPLE_RATE * CHANNELS * SAMPLE_WIDTH))
+
+# ffmpeg output we never read goes straight to /dev/null (no pipe to drain)
+DEVNULL = subprocess.DEVNULL
+
+# Shortest first segment left by an initial silence correction (seconds)
+MIN_SEGMENT_DURATION = 0.1
+
+# Any Unicode letter: segments without one ('♪', '...', '2024') are not translated
+LETTER_RE = re.compile(r'[^\W\d_]')
 
 
 class AudioSynchronizer:
@@ -23,8 +55,14 @@ class AudioSynchronizer:
     that preserves original timing, including pauses and silences.
     """
 
-    def __init__(self):
-        """Initialize audio synchronizer"""
+    def __init__(self, max_workers: int = 8):
+        """
+        Initialize audio synchronizer
+
+        Args:
+            max_workers: Parallel TTS syntheses per video (default: 8)
+        """
+        self.max_workers = max_workers
         self.logger = logging.getLogger('speechbridge.audiosync')
 
     def synchronize_segments(
@@ -58,139 +96,84 @@ class AudioSynchronizer:
                 {'segments': len(segments), 'texts': len(translated_texts)}
             )
 
-        output_path = Path(output_dir)
+        # Absolute once: segment paths go into the ffmpeg concat list as-is
+        output_path = Path(output_dir).absolute()
         output_path.mkdir(exist_ok=True, parents=True)
 
         self.logger.info(f"Synchronizing {len(segments)} audio segments")
 
         # Detect actual speech start time to correct Whisper timing
-        actual_speech_start = 0.0
         if original_audio_path and segments:
-            actual_speech_start = self._detect_speech_start(original_audio_path)
-
-            # If first segment starts before actual speech, adjust it
-            if segments[0]['start'] < actual_speech_start - 0.5:  # 500ms tolerance
-                self.logger.info(
-                    f"Detected silence at start: {actual_speech_start:.2f}s "
-                    f"(Whisper reported: {segments[0]['start']:.2f}s)"
-                )
-                # Adjust first segment start time
-                segments[0]['start'] = actual_speech_start
-
-        # Step 1: Generate TTS for each segment
-        segment_files = []
-        for i, (seg, text) in enumerate(zip(segments, translated_texts)):
-            segment_audio = output_path / f"segment_{i:04d}.wav"
-            segment_audio_normalized = output_path / f"segment_norm_{i:04d}.wav"
+            self.correct_speech_start(segments, self._detect_speech_start(original_audio_path))
+
+        # Step 1: Synthesize each segment and fit it to its original duration.
+        # Segments run concurrently: TTS is network-bound and the fitting
+        # ffmpeg runs in its own process, so both overlap across workers.
+        # Segments with the same text (repeated lines, intros) share one
+        # synthesis; each is still fitted to its own duration.
+        text_groups: Dict[str, List[int]] = {}
+        for i, text in enumerate(translated_texts):
+            text_groups.setdefault(text, []).append(i)
+
+        def process_group(indices: List[int]) -> List[Dict[str, Any]]:
+            first = indices[0]
+            text = translated_texts[first]
+            segment_audio = output_path / f"segment_{first:04d}.wav"
 
             try:
-                # Synthesize this segment
+                # Synthesize this text once
                 tts_result = tts_engine.synthesize(
                     text,
                     str(segment_audio),
                     language=target_lang
                 )
+            except Exception as e:
+                self.logger.error(f"Failed to synthesize segment {first}: {e}")
+                raise
 
-                original_duration = seg['end'] - seg['start']
-                tts_duration = tts_result['duration']
-
-                # Calculate speed adjustment needed
-                speed_factor = tts_duration / original_duration if original_duration > 0 else 1.0
-
-                # Always normalize and adjust to match original duration exactly
-                if abs(speed_factor - 1.0) > 0.05:  # More than 5% difference
-                    # Need to adjust speed to match timing
-                    if speed_factor > 2.0:
-                        # atempo has max limit of 2.0, need to chain filters
-                        self.logger.debug(
-                            f"Segment {i}: Large speed adjustment needed "
-                            f"({tts_duration:.2f}s -> {original_duration:.2f}s, factor: {speed_factor:.2f}x)"
-                        )
-                        # Chain multiple atempo filters
-                        atempo_filters = []
-                        remaining_factor = speed_factor
-                        while remaining_factor > 2.0:
-                            atempo_filters.append('atempo=2.0')
-                            remaining_factor /= 2.0
-                        if remaining_factor > 0.5:  # atempo min is 0.5
-                            atempo_filters.append(f'atempo={remaining_factor}')
-                        filter_string = ','.join(atempo_filters)
-                    elif speed_factor < 0.5:
-                        # atempo has min limit of 0.5, need to chain
-                        atempo_filters = []
-                        remaining_factor = speed_factor
-                        while remaining_factor < 0.5:
-                            atempo_filters.append('atempo=0.5')
-                            remaining_factor /= 0.5
-                        if remaining_factor <= 2.0:
-                            atempo_filters.append(f'atempo={remaining_factor}')
-                        filter_string = ','.join(atempo_filters)
-                    else:
-                        # Single atempo filter is enough
-                        filter_string = f'atempo={speed_factor}'
-
-                    # Normalize format AND adjust speed to match original duration
-                    normalize_cmd = [
-                        'ffmpeg', '-y',
-                        '-i', str(segment_audio),
-                        '-filter:a', filter_string,
-                        '-ac', '2',  # Stereo
-                        '-ar', '44100',  # Sample rate
-                        '-c:a', 'pcm_s16le',  # PCM format
-                        str(segment_audio_normalized)
-                    ]
-
-                    self.logger.debug(
-                        f"Segment {i}: Adjusting speed {tts_duration:.2f}s -> {original_duration:.2f}s (factor: {speed_factor:.2f}x)"
-                    )
-                else:
-                    # Just normalize format, duration is close enough
-                    normalize_cmd = [
-                        'ffmpeg', '-y',
-                        '-i', str(segment_audio),
-                        '-ac', '2',  # Stereo
-                        '-ar', '44100',  # Sample rate
-                        '-c:a', 'pcm_s16le',  # PCM format
-                        str(segment_audio_normalized)
-                    ]
-
-                subprocess.run(
-                    normalize_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
-                )
+            fitted = []
+            for i in indices:
+                try:
+                    fitted.append(self._fit_segment(
+                        i,
+                        segments[i],
+                        text,
+                        tts_result['duration'],
+                        segment_audio,
+                        output_path / f"segment_norm_{i:04d}.wav"
+                    ))
+                except Exception as e:
+                    self.logger.error(f"Failed to adjust segment {i}: {e}")
+                    raise
+            return fitted
+
+        # Initialize once up front so workers don't race on it
+        if not tts_engine.is_initialized():
+            tts_engine.initialize()
+
+        groups = list(text_groups.values())
+        if len(groups) < len(segments):
+            self.logger.info(
+                f"Reusing speech for {len(segments) - len(groups)} repeated segments"
+            )
 
-                # Use normalized file with adjusted duration
-                used_file = str(segment_audio_normalized)
-                used_duration = original_duration  # Now matches original exactly
-
-                segment_info = {
-                    'file': used_file,
-                    'start': seg['start'],
-                    'end': seg['end'],
-                    'original_duration': original_duration,
-                    'tts_duration': tts_duration,
-                    'used_duration': used_duration,
-                    'text': text
-                }
-                segment_files.append(segment_info)
-
-                self.logger.debug(
-                    f"Segment {i+1}/{len(segments)}: "
-                    f"[{seg['start']:.2f}s - {seg['end']:.2f}s] "
-                    f"TTS: {tts_duration:.2f}s -> {used_duration:.2f}s"
-                )
+        workers = max(1, min(self.max_workers, len(groups)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() keeps group order; the first failure is re-raised here
+            group_files = list(executor.map(process_group, groups))
 
-            except Exception as e:
-                self.logger.error(f"Failed to synthesize segment {i}: {e}")
-                raise
+        # Back to segment order
+        segment_files = [None] * len(segments)
+        for indices, fitted in zip(groups, group_files):
+            for i, segment_file in zip(indices, fitted):
+                segment_files[i] = segment_file
 
         self.logger.info(f"Generated {len(segment_files)} TTS segments")
 
         # Step 2: Create timeline with silence padding
-        timeline_file = output_path / f"timeline_{datetime.now().timestamp()}.txt"
-        final_audio = output_path / f"synchronized_{datetime.now().timestamp()}.wav"
+        stamp = format(time.time_ns(), 'x')
+        timeline_file = output_path / f"timeline_{stamp}.txt"
+        final_audio = output_path / f"synchronized_{stamp}.wav"
 
         self._create_synchronized_audio(
             segment_files,
@@ -203,6 +186,132 @@ class AudioSynchronizer:
 
         return str(final_audio), segments
 
+    def _fit_segment(
+        self,
+        index: int,
+        seg: Dict[str, Any],
+        text: str,
+        tts_duration: float,
+        segment_audio: Path,
+        segment_audio_normalized: Path
+    ) -> Dict[str, Any]:
+        """
+        Fit synthesized segment audio to the original segment duration
+
+        One ffmpeg pass: adjust speed (if needed), normalize format, and
+        pad/trim to the exact sample count of the original segment, so the
+        file can go straight into the timeline.
+
+        Args:
+            index: Segment index (for logging)
+            seg: Whisper segment with timing
+            text: Translated text of the segment
+            tts_duration: Duration of synthesized audio
+            segment_audio: Synthesized audio file
+            segment_audio_normalized: Output path for fitted audio
+
+        Returns:
+            Dict: Segment info for the timeline
+        """
+        original_duration = seg['end'] - seg['start']
+
+        # Calculate speed adjustment needed
+        speed_factor = tts_duration / original_duration if original_duration > 0 else 1.0
+
+        filters = []
+        if abs(speed_factor - 1.0) > 0.05:  # More than 5% difference
+            filters.append(self._atempo_filter(speed_factor))
+
+            self.logger.debug(
+                f"Segment {index}: Adjusting speed {tts_duration:.2f}s -> {original_duration:.2f}s (factor: {speed_factor:.2f}x)"
+            )
+
+        exact_samples = round(original_duration * SAMPLE_RATE)
+        filters.extend([
+            RESAMPLE_FILTER,
+            f'apad=whole_len={exact_samples}',
+            f'atrim=end_sample={exact_samples}'
+        ])
+
+        # Stereo, 44.1 kHz, PCM
+        normalize_cmd = [
+            'ffmpeg', '-y',
+            '-i', str(segment_audio),
+            '-filter:a', ','.join(filters),
+            *PCM_OUTPUT_ARGS,
+            str(segment_audio_normalized)
+        ]
+
+        result = subprocess.run(
+            normalize_cmd,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+
+        if result.returncode != 0:
+            self.logger.error(f"ffmpeg failed to fit segment {index}: {result.stderr[-500:]}")
+            raise ComponentException(
+                f"Failed to fit segment {index} audio",
+                {'file': str(segment_audio), 'error': result.stderr[-200:]}
+            )
+
+        # Normalized file now matches original duration exactly
+        used_duration = original_duration
+
+        self.logger.debug(
+            f"Segment {index + 1}: "
+            f"[{seg['start']:.2f}s - {seg['end']:.2f}s] "
+            f"TTS: {tts_duration:.2f}s -> {used_duration:.2f}s"
+        )
+
+        return {
+            'file': str(segment_audio_normalized),
+            'start': seg['start'],
+            'end': seg['end'],
+            'original_duration': original_duration,
+            'tts_duration': tts_duration,
+            'used_duration': used_duration,
+            'text': text
+        }
+
+    def _atempo_filter(self, speed_factor: float) -> str:
+        """
+        Build atempo filter chain for a speed factor
+
+        atempo accepts factors in [0.5, 2.0]; larger changes are chained.
+
+        Args:
+            speed_factor: Required speed multiplier
+
+        Returns:
+            str: Filter string (e.g. 'atempo=2.0,atempo=1.3')
+        """
+        if speed_factor > 2.0:
+            # atempo has max limit of 2.0, need to chain filters
+            atempo_filters = []
+            remaining_factor = speed_factor
+            while remaining_factor > 2.0:
+                atempo_filters.append('atempo=2.0')
+                remaining_factor /= 2.0
+            if remaining_factor > 0.5:  # atempo min is 0.5
+                atempo_filters.append(f'atempo={remaining_factor}')
+            return ','.join(atempo_filters)
+
+        if speed_factor < 0.5:
+            # atempo has min limit of 0.5, need to chain
+            atempo_filters = []
+            remaining_factor = speed_factor
+            while remaining_factor < 0.5:
+                atempo_filters.append('atempo=0.5')
+                remaining_factor /= 0.5
+            if remaining_factor <= 2.0:
+                atempo_filters.append(f'atempo={remaining_factor}')
+            return ','.join(atempo_filters)
+
+        # Single atempo filter is enough
+        return f'atempo={speed_factor}'
+
     def _create_synchronized_audio(
         self,
         segments: List[Dict[str, Any]],
@@ -215,147 +324,29 @@ class AudioSynchronizer:
 
         Args:
             segments: List of segment info dicts
-            timeline_file: Path to timeline file
+            timeline_file: Path for the concat list (ffmpeg fallback only)
             output_file: Path to output audio
             total_duration: Total duration in seconds
         """
-        # Strategy: Create concat demuxer file with silence padding
+        # Strategy: build a timeline of segment files and silence gaps
         # This ensures segments don't overlap
+        # Silence is kept as a duration (seconds) and only becomes a file
+        # if the ffmpeg fallback needs one
 
         concat_file = timeline_file
-        concat_entries = []
 
         current_time = 0.0
-        temp_files = []
+        timeline: List[Union[str, Path, float]] = []
+        parent = output_file.parent
 
-        for i, seg in enumerate(segments):
+        for seg in segments:
             # Add silence if needed before this segment
             if seg['start'] > current_time:
-                silence_duration = seg['start'] - current_time
-                silence_file = output_file.parent / f"silence_{i:04d}.wav"
-
-                # Create silence using ffmpeg
-                silence_cmd = [
-                    'ffmpeg', '-y',
-                    '-f', 'lavfi',
-                    '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100',
-                    '-t', str(silence_duration),
-                    '-c:a', 'pcm_s16le',
-                    str(silence_file)
-                ]
-
-                subprocess.run(
-                    silence_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
-                )
-
-                concat_entries.append(f"file '{Path(silence_file).absolute()}'")
-                temp_files.append(silence_file)
+                timeline.append(float(seg['start'] - current_time))
                 current_time = seg['start']
 
-            # Add the actual segment with EXACT duration control
-            exact_duration = seg['end'] - seg['start']
-
-            # Create segment file with exact duration
-            exact_file = output_file.parent / f"exact_{i:04d}.wav"
-
-            # Strategy:
-            # 1. First trim segment to MAXIMUM exact_duration using -t flag (this ACTUALLY works)
-            # 2. Check actual duration with ffprobe
-            # 3. If shorter, pad to exact_duration with silence
-
-            # Step 1: Trim to max duration (will cut if longer, pass through if shorter)
-            trimmed_file = output_file.parent / f"trimmed_{i:04d}.wav"
-
-            trim_cmd = [
-                'ffmpeg', '-y',
-                '-i', str(seg['file']),
-                '-t', str(exact_duration),  # Hard limit - cuts at this duration
-                '-c:a', 'pcm_s16le',
-                str(trimmed_file)
-            ]
-
-            subprocess.run(
-                trim_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=60
-            )
-
-            # Step 2: Get actual duration
-            probe_cmd = [
-                'ffprobe',
-                '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                str(trimmed_file)
-            ]
-
-            probe_result = subprocess.run(
-                probe_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=30
-            )
-
-            actual_duration = float(probe_result.stdout.strip())
-
-            # Step 3: Pad if needed
-            if actual_duration < exact_duration - 0.001:  # 1ms tolerance
-                padding_needed = exact_duration - actual_duration
-
-                # Create padding silence
-                padding_file = output_file.parent / f"padding_{i:04d}.wav"
-
-                pad_cmd = [
-                    'ffmpeg', '-y',
-                    '-f', 'lavfi',
-                    '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100',
-                    '-t', str(padding_needed),
-                    '-c:a', 'pcm_s16le',
-                    str(padding_file)
-                ]
-
-                subprocess.run(
-                    pad_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
-                )
-
-                # Concatenate trimmed + padding
-                concat_list_file = output_file.parent / f"concat_{i:04d}.txt"
-                concat_list_file.write_text(
-                    f"file '{trimmed_file.absolute()}'\n"
-                    f"file '{padding_file.absolute()}'"
-                )
-
-                concat_cmd = [
-                    'ffmpeg', '-y',
-                    '-f', 'concat',
-                    '-safe', '0',
-                    '-i', str(concat_list_file),
-                    '-c:a', 'pcm_s16le',
-                    str(exact_file)
-                ]
-
-                subprocess.run(
-                    concat_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    timeout=60
-                )
-
-                temp_files.extend([trimmed_file, padding_file, concat_list_file])
-            else:
-                # Duration is already exact (or close enough), just use trimmed file
-                exact_file = trimmed_file
-
-            concat_entries.append(f"file '{Path(exact_file).absolute()}'")
-            temp_files.append(exact_file)
+            # Segment files are already cut/padded to their exact duration
+            timeline.append(seg['file'])
 
             # Update current_time to END of this segment (from original timing)
             # This ensures we track the timeline according to Whisper segments
@@ -366,39 +357,34 @@ class AudioSynchronizer:
         final_silence_needed = total_duration - current_time
 
         if final_silence_needed > 0.001:  # Add silence if needed (tolerance 1ms)
-            final_silence_file = output_file.parent / "silence_final.wav"
-
-            # Create exact silence duration using sample count for precision
-            # 44100 samples/sec * duration = exact sample count
-            sample_count = int(final_silence_needed * 44100)
-
-            # Generate silence with exact sample count
-            silence_cmd = [
-                'ffmpeg', '-y',
-                '-f', 'lavfi',
-                '-i', f'anullsrc=channel_layout=stereo:sample_rate=44100',
-                '-t', str(final_silence_needed),
-                '-c:a', 'pcm_s16le',
-                str(final_silence_file)
-            ]
-
-            subprocess.run(
-                silence_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=60
-            )
-
-            concat_entries.append(f"file '{Path(final_silence_file).absolute()}'")
-            temp_files.append(final_silence_file)
+            timeline.append(float(final_silence_needed))
 
             self.logger.info(
                 f"Added final silence: {final_silence_needed:.3f}s "
                 f"to reach total duration {total_duration:.3f}s"
             )
 
-        # Write concat file
-        concat_file.write_text('\n'.join(concat_entries))
+        # All inputs are normally pcm_s16le stereo 44.1 kHz: join the
+        # sample data directly instead of decoding and re-encoding it
+        try:
+            if self._concat_wav(timeline, output_file):
+                self.logger.info("Audio synchronization complete")
+                return
+        except (wave.Error, EOFError, OSError) as e:
+            self.logger.debug(f"WAV concatenation failed ({e}), using ffmpeg")
+
+        # ffmpeg needs every input as a file: write silence gaps out
+        inputs = []
+        for i, item in enumerate(timeline):
+            if isinstance(item, float):
+                silence_file = parent / f"silence_{i:04d}.wav"
+                self._write_silence_wav(silence_file, item)
+                item = silence_file
+            inputs.append(item)
+
+        # Write concat file (paths are absolute: output_dir was resolved)
+        concat_entries = [f"file '{path}'" for path in inputs]
+        concat_file.write_text('\n'.join(concat_entries), encoding='utf-8')
 
         # Build ffmpeg command using concat demuxer
         cmd = [
@@ -406,8 +392,8 @@ class AudioSynchronizer:
             '-f', 'concat',
             '-safe', '0',
             '-i', str(concat_file),
-            '-ac', '2',  # Stereo
-            '-ar', '44100',  # Sample rate
+            '-ac', str(CHANNELS),
+            '-ar', str(SAMPLE_RATE),
             str(output_file)
         ]
 
@@ -416,7 +402,7 @@ class AudioSynchronizer:
         try:
             result = subprocess.run(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdout=DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
                 timeout=300  # 5 minutes timeout
@@ -438,6 +424,123 @@ class AudioSynchronizer:
                 f"Audio synchronization failed: {e}"
             )
 
+    def _concat_wav(self, timeline: List[Union[str, Path, float]], output_file: Path) -> bool:
+        """
+        Concatenate WAV files and silence gaps by copying sample data
+
+        Only used when every input already has the output format
+        (pcm_s16le stereo 44.1 kHz); data is copied in 1-second blocks.
+        Silence gaps are written straight from a shared zero block.
+
+        Args:
+            timeline: WAV files and silence durations (seconds) in order
+            output_file: Output WAV path
+
+        Returns:
+            bool: False if an input has a different format (nothing usable
+            was written and ffmpeg should be used instead)
+        """
+        expected = (CHANNELS, SAMPLE_WIDTH, SAMPLE_RATE)
+
+        with wave.open(str(output_file), 'wb') as out:
+            out.setnchannels(CHANNELS)
+            out.setsampwidth(SAMPLE_WIDTH)
+            out.setframerate(SAMPLE_RATE)
+
+            for item in timeline:
+                if isinstance(item, float):
+                    self._write_silence_frames(out, round(item * SAMPLE_RATE))
+                    continue
+
+                with wave.open(str(item), 'rb') as inp:
+                    params = inp.getparams()
+                    if (params.nchannels, params.sampwidth, params.framerate) != expected:
+                        self.logger.debug(f"{item} is not {expected}, using ffmpeg")
+                        return False
+
+                    while True:
+                        data = inp.readframes(SAMPLE_RATE)
+                        if not data:
+                            break
+                        out.writeframesraw(data)
+
+        return True
+
+    def _write_silence_wav(self, path: Path, duration: float) -> None:
+        """
+        Write a silent pcm_s16le stereo 44.1 kHz WAV file
+
+        Silence is all-zero PCM, so no encoder (or ffmpeg process) is
+        needed.
+
+        Args:
+            path: Output WAV path
+            duration: Silence duration in seconds
+        """
+        frames = round(duration * SAMPLE_RATE)
+
+        with wave.open(str(path), 'wb') as wav:
+            wav.setnchannels(CHANNELS)
+            wav.setsampwidth(SAMPLE_WIDTH)
+            wav.setframerate(SAMPLE_RATE)
+            wav.setnframes(frames)
+
+            self._write_silence_frames(wav, frames)
+
+    def _write_silence_frames(self, wav: wave.Wave_write, frames: int) -> None:
+        """
+        Write zero frames in 1-second slices of the shared SILENCE_BLOCK
+
+        Slices are memoryview windows, so no buffer is allocated per gap.
+
+        Args:
+            wav: WAV file opened for writing (timeline format)
+            frames: Number of frames to write
+        """
+        frame_size = CHANNELS * SAMPLE_WIDTH
+
+        while frames > 0:
+            n = min(frames, SAMPLE_RATE)
+            wav.writeframesraw(SILENCE_BLOCK[:n * frame_size])
+            frames -= n
+
+    def correct_speech_start(
+        self,
+        segments: List[Dict[str, Any]],
+        speech_start: Optional[float]
+    ) -> bool:
+        """
+        Move the first segment start to the detected speech start
+
+        Whisper often starts the first segment at 0 when the audio opens
+        with silence. The correction applies only beyond a 500ms tolerance
+        and never moves the start to or past the segment end.
+
+        Args:
+            segments: Whisper segments (first one is corrected in place)
+            speech_start: Detected speech start in seconds (None: unknown)
+
+        Returns:
+            bool: True if the first segment was corrected
+        """
+        if not segments or not speech_start:
+            return False
+
+        first_segment = segments[0]
+        if first_segment['start'] >= speech_start - 0.5:  # 500ms tolerance
+            return False
+
+        new_start = min(speech_start, first_segment['end'] - MIN_SEGMENT_DURATION)
+        if new_start <= first_segment['start']:
+            return False
+
+        self.logger.info(
+            f"Correcting initial silence: {new_start:.2f}s "
+            f"(Whisper reported: {first_segment['start']:.2f}s)"
+        )
+        first_segment['start'] = new_start
+        return True
+
     def _detect_speech_start(self, audio_path: str) -> float:
         """
         Detect when speech actually starts in the audio
@@ -448,32 +551,52 @@ class AudioSynchronizer:
         Returns:
             float: Time in seconds when speech starts
         """
+        # Fast path: scan PCM samples in-process (no ffmpeg decode pass)
+        try:
+            speech_start = self._detect_speech_start_pcm(audio_path)
+            if speech_start is not None:
+                self.logger.debug(f"Detected speech start at {speech_start:.2f}s")
+                return speech_start
+        except ImportError:
+            pass
+        except (wave.Error, EOFError, OSError) as e:
+            self.logger.debug(f"PCM speech detection unavailable ({e}), using ffmpeg")
+
         try:
             # Use ffmpeg silencedetect to find when silence ends
             cmd = [
                 'ffmpeg',
+                '-hide_banner', '-nostats',
                 '-i', audio_path,
-                '-af', 'silencedetect=noise=-30dB:d=0.5',
+                '-af', SILENCEDETECT_FILTER,
                 '-f', 'null',
                 '-'
             ]
 
-            result = subprocess.run(
+            # Read stderr as it is produced and stop ffmpeg once the
+            # leading silence is resolved: the rest is not decoded
+            proc = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
+                stdin=DEVNULL,
+                stdout=DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True,
-                timeout=60
+                text=True
             )
+            watchdog = threading.Timer(60, proc.kill)
+            watchdog.start()
 
-            # Parse output for first silence_end
-            for line in result.stderr.split('\n'):
-                if 'silence_end:' in line:
-                    # Extract time: "silence_end: 8.14575 | silence_duration: 8.14575"
-                    parts = line.split('silence_end:')[1].split('|')[0].strip()
-                    speech_start = float(parts)
-                    self.logger.debug(f"Detected speech start at {speech_start:.2f}s")
-                    return speech_start
+            try:
+                speech_start = leading_silence_end(proc.stderr)
+            finally:
+                watchdog.cancel()
+                if proc.poll() is None:
+                    proc.kill()
+                proc.stderr.close()
+                proc.wait()
+
+            if speech_start is not None:
+                self.logger.debug(f"Detected speech start at {speech_start:.2f}s")
+                return speech_start
 
             # No silence detected at start, speech starts at 0
             return 0.0
@@ -482,6 +605,49 @@ class AudioSynchronizer:
             self.logger.warning(f"Failed to detect speech start: {e}")
             return 0.0
 
+    def _detect_speech_start_pcm(self, audio_path: str) -> Optional[float]:
+        """
+        Detect speech start by scanning 16-bit PCM WAV samples with NumPy
+
+        Reads the file in 1-second blocks and stops at the first sample
+        above the silence threshold, so only the leading silence is read.
+
+        Args:
+            audio_path: Path to WAV file
+
+        Returns:
+            Optional[float]: Speech start in seconds, or None if the file
+            is not 16-bit PCM WAV
+
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        import numpy as np
+
+        with wave.open(audio_path, 'rb') as wav:
+            if wav.getsampwidth() != 2:
+                return None
+
+            channels = wav.getnchannels()
+            frame_rate = wav.getframerate()
+            threshold = int(32768 * 10 ** (SILENCE_THRESHOLD_DB / 20))
+
+            frames_read = 0
+            while True:
+                block = wav.readframes(frame_rate)
+                if not block:
+                    # Entire file is silent
+                    return 0.0
+
+                samples = np.frombuffer(block, dtype='<i2')
+                loud = np.flatnonzero((samples > threshold) | (samples < -threshold))
+                if loud.size:
+                    speech_start = float(frames_read + loud[0] // channels) / frame_rate
+                    # Shorter leading pauses are not reported as silence
+                    return speech_start if speech_start >= MIN_SILENCE_DURATION else 0.0
+
+                frames_read += len(samples) // channels
+
     def translate_segments(
         self,
         segments: List[Dict[str, Any]],
@@ -492,6 +658,10 @@ class AudioSynchronizer:
         """
         Translate each segment individually to preserve timing
 
+        Segments containing letters are sent through translator.translate_batch()
+        in one call (one request per batch for DeepL), each distinct text
+        once. If the batch call fails, segments are translated one by one.
+
         Args:
             segments: Whisper segments
             translator: Translator instance
@@ -503,32 +673,63 @@ class AudioSynchronizer:
         """
         self.logger.info(f"Translating {len(segments)} segments")
 
-        translated_texts = []
+        texts = [seg['text'].strip() for seg in segments]
+        translated_texts = [""] * len(texts)
 
-        for i, seg in enumerate(segments):
-            text = seg['text'].strip()
+        # Only texts with letters are sent; empty segments stay "" and
+        # letterless ones (music notes, numbers, punctuation) are kept as is
+        indices = []
+        for i, text in enumerate(texts):
+            if LETTER_RE.search(text):
+                indices.append(i)
+            else:
+                translated_texts[i] = text
 
-            if not text:
-                translated_texts.append("")
-                continue
+        if not indices:
+            return translated_texts
 
-            try:
-                result = translator.translate(
-                    text,
-                    source_lang=source_lang,
-                    target_lang=target_lang
-                )
-                translated_texts.append(result['text'])
+        # Repeated segment texts are translated once
+        unique_texts = list(dict.fromkeys(texts[i] for i in indices))
 
-                self.logger.debug(
-                    f"Segment {i+1}/{len(segments)}: "
-                    f"{len(text)} -> {len(result['text'])} chars"
+        try:
+            results = translator.translate_batch(
+                unique_texts,
+                source_lang=source_lang,
+                target_lang=target_lang
+            )
+            if len(results) != len(unique_texts):
+                raise ValueError(
+                    f"Batch returned {len(results)} results for {len(unique_texts)} texts"
                 )
 
-            except Exception as e:
-                self.logger.error(f"Failed to translate segment {i}: {e}")
-                # Use original text as fallback
-                translated_texts.append(text)
+            translations = {
+                text: result['text'] for text, result in zip(unique_texts, results)
+            }
+            for i in indices:
+                translated_texts[i] = translations[texts[i]]
+
+        except Exception as e:
+            self.logger.warning(f"Batch translation failed ({e}), translating segments one by one")
+
+            for i in indices:
+                text = texts[i]
+                try:
+                    result = translator.translate(
+                        text,
+                        source_lang=source_lang,
+                        target_lang=target_lang
+                    )
+                    translated_texts[i] = result['text']
+
+                    self.logger.debug(
+                        f"Segment {i+1}/{len(segments)}: "
+                        f"{len(text)} -> {len(result['text'])} chars"
+                    )
+
+                except Exception as e:
+                    self.logger.error(f"Failed to translate segment {i}: {e}")
+                    # Use original text as fallback
+                    translated_texts[i] = text
 
         self.logger.info(f"Translated {len(translated_texts)} segments")
 
@@ -0,0 +1,301 @@
+"""
+Faster-Whisper Speech Recognition
+=================================
+
+Whisper speech recognition on the CTranslate2 runtime (faster-whisper).
+Runs quantized INT8 on CPU and FP16 on CUDA.
+"""
+
+from typing import Dict, Any, Optional
+from functools import lru_cache
+import os
+
+from .whisper import WhisperRecognizer
+from speechbridge.core.types import TranscriptionResult
+from speechbridge.core.exceptions import ComponentException
+
+
+@lru_cache(maxsize=2)
+def _load_faster_whisper_model(
+    model_name: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int
+) -> Any:
+    """
+    Load faster-whisper model (cached per process)
+
+    Args:
+        model_name: Whisper model size
+        device: Target device ('cuda' or 'cpu')
+        compute_type: CTranslate2 compute type
+        cpu_threads: Threads for CPU inference
+
+    Returns:
+        faster_whisper.WhisperModel
+    """
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads
+    )
+
+
+class FasterWhisperRecognizer(WhisperRecognizer):
+    """
+    Faster-Whisper speech recognizer
+
+    Drop-in replacement for WhisperRecognizer with the same result
+    shape, backed by CTranslate2 kernels and quantized weights.
+    Uses roughly 4x less time and 3x less memory than PyTorch Whisper.
+    """
+
+    SUPPORTED_MODELS = WhisperRecognizer.SUPPORTED_MODELS + [
+        'tiny.en', 'base.en', 'small.en', 'medium.en',
+        'large-v3-turbo', 'distil-large-v3'
+    ]
+
+    # Default compute type for each device (CTranslate2 has no MPS backend)
+    DEFAULT_COMPUTE_TYPES = {
+        'cuda': 'float16',
+        'cpu': 'int8',
+    }
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize Faster-Whisper recognizer
+
+        Args:
+            config: Configuration with parameters:
+                - model: Model size (default: 'base')
+                - use_gpu: Use GPU if available (default: True)
+                - language: Source language (default: 'auto')
+                - task: 'transcribe' or 'translate' (default: 'transcribe')
+                - compute_type: CTranslate2 compute type (default:
+                  SPEECHBRIDGE_COMPUTE_TYPE env var, else 'float16' on CUDA,
+                  'int8' on CPU)
+                - beam_size: Beam size for decoding (default: 1, greedy)
+                - vad_filter: Skip silence with Silero VAD (default: True)
+                - word_timestamps: Add word-level timing to segments (default: False)
+                - batch_size: Decode VAD chunks in batches of this size through
+                  BatchedInferencePipeline (default: None, sequential)
+                - cpu_threads: Threads for CPU inference (default: CPUs
+                  available to the process)
+        """
+        super().__init__(config)
+
+        # CTranslate2 supports CUDA and CPU only
+        if self.device not in self.DEFAULT_COMPUTE_TYPES:
+            self.logger.info(f"Device '{self.device}' not supported by faster-whisper, using CPU")
+            self.device = 'cpu'
+
+        self.compute_type = (
+            self.config.get('compute_type')
+            or os.getenv('SPEECHBRIDGE_COMPUTE_TYPE')
+            or self.DEFAULT_COMPUTE_TYPES[self.device]
+        )
+        self.beam_size = self.config.get('beam_size', 1)
+        self.vad_filter = self.config.get('vad_filter', True)
+        self.word_timestamps = self.config.get('word_timestamps', False)
+        self.batch_size = self.config.get('batch_size')
+        self.pipeline = None
+
+    def initialize(self) -> None:
+        """
+        Initialize Faster-Whisper model
+
+        Loads the CTranslate2 model with the configured compute type
+        """
+        if self._initialized:
+            return
+
+        try:
+            import faster_whisper  # noqa: F401 - fail early with install hint
+
+            self.logger.info(
+                f"Loading faster-whisper model '{self.model_name}' on {self.device} "
+                f"({self.compute_type})"
+            )
+
+            self.model = _load_faster_whisper_model(
+                self.model_name,
+                self.device,
+                self.compute_type,
+                self.cpu_threads
+            )
+
+            # Batched decoding of VAD chunks (many <=30s windows per encoder call)
+            if self.batch_size:
+                try:
+                    from faster_whisper import BatchedInferencePipeline
+                except ImportError:
+                    raise ComponentException(
+                        "Batched inference (batch_size) requires faster-whisper 1.1 or newer",
+                        {'solution': 'pip install -U "faster-whisper>=1.1"'}
+                    )
+                self.pipeline = BatchedInferencePipeline(model=self.model)
+                self.logger.info(f"Batched inference enabled (batch_size={self.batch_size})")
+
+            self._initialized = True
+            self.logger.info(f"Faster-whisper model loaded successfully on {self.device}")
+
+        except ComponentException:
+            raise
+        except ImportError:
+            raise ComponentException(
+                "faster-whisper library not installed",
+                {'solution': 'pip install faster-whisper'}
+            )
+        except Exception as e:
+            raise ComponentException(
+                f"Failed to load faster-whisper model: {e}",
+                {'model': self.model_name, 'device': self.device, 'compute_type': self.compute_type}
+            )
+
+    def warmup(self) -> None:
+        """
+        Load model and run one inference on 1 second of silence
+
+        VAD is disabled for the dummy input, otherwise the decoder would
+        never run on silence.
+        """
+        if not self._initialized:
+            self.initialize()
+
+        try:
+            import numpy as np
+
+            segments, _ = self.model.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                task=self.task,
+                beam_size=self.beam_size,
+                vad_filter=False,
+                language=None if self.language == 'auto' else self.language
+            )
+            # Segments are lazy: consume them to actually decode
+            for _ in segments:
+                pass
+            self.logger.info("Faster-whisper model warmed up")
+        except Exception as e:
+            self.logger.warning(f"Faster-whisper warmup failed: {e}")
+
+    def transcribe(self, audio_path: str) -> TranscriptionResult:
+        """
+        Transcribe audio using Faster-Whisper
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            TranscriptionResult: Transcription with segments and metadata
+        """
+        # Ensure model is loaded
+        if not self._initialized:
+            self.initialize()
+
+        try:
+            self.logger.info(f"Transcribing: {audio_path}")
+
+            # Prepare transcription options
+            options = {
+                'task': self.task,
+                'beam_size': self.beam_size,
+                'vad_filter': self.vad_filter,
+                'word_timestamps': self.word_timestamps
+            }
+
+            # Set language if not auto-detect
+            if self.language != 'auto':
+                options['language'] = self.language
+
+            # Segments are produced lazily while decoding
+            if self.pipeline is not None:
+                segments_iter, info = self.pipeline.transcribe(
+                    audio_path,
+                    batch_size=self.batch_size,
+                    **options
+                )
+            else:
+                segments_iter, info = self.model.transcribe(audio_path, **options)
+            segments = [self._segment_to_dict(seg) for seg in segments_iter]
+
+            # Build result in the same shape as openai-whisper
+            result = {
+                'text': ''.join(seg['text'] for seg in segments),
+                'language': info.language,
+                'segments': segments
+            }
+
+            transcription: TranscriptionResult = {
+                'text': result['text'].strip(),
+                'language': result['language'] or self.language,
+                'confidence': self._calculate_confidence(result),
+                'segments': segments,
+                'duration': info.duration or self._get_audio_duration(result)
+            }
+
+            self.logger.info(
+                f"Transcription complete: {len(transcription['text'])} chars"
+            )
+
+            return transcription
+
+        except Exception as e:
+            raise ComponentException(
+                f"Faster-whisper transcription failed: {e}",
+                {'audio': audio_path, 'model': self.model_name}
+            )
+
+    def _segment_to_dict(self, segment: Any) -> Dict[str, Any]:
+        """
+        Convert faster-whisper segment to openai-whisper segment dict
+
+        Args:
+            segment: faster-whisper Segment
+
+        Returns:
+            Dict: Segment with id, start, end, text and scores
+        """
+        result = {
+            'id': segment.id,
+            'start': segment.start,
+            'end': segment.end,
+            'text': segment.text,
+            'avg_logprob': segment.avg_logprob,
+            'no_speech_prob': segment.no_speech_prob,
+            'compression_ratio': segment.compression_ratio,
+            'temperature': segment.temperature
+        }
+
+        if segment.words:
+            result['words'] = [
+                {
+                    'word': word.word,
+                    'start': word.start,
+                    'end': word.end,
+                    'probability': word.probability
+                }
+                for word in segment.words
+            ]
+
+        return result
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get Faster-Whisper recognizer information
+
+        Returns:
+            Dict: Complete info including model and runtime details
+        """
+        info = super().get_info()
+        info.update({
+            'backend': 'ctranslate2',
+            'compute_type': self.compute_type,
+            'beam_size': self.beam_size,
+            'vad_filter': self.vad_filter,
+            'batch_size': self.batch_size
+        })
+        return info
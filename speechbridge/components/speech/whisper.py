@@ -7,12 +7,72 @@ OpenAI Whisper-based speech recognition with GPU acceleration.
 
 from typing import Dict, Any, Optional
 from pathlib import Path
+from functools import lru_cache
+import os
+import threading
 
 from .base import BaseSpeechRecognizer
 from speechbridge.core.types import TranscriptionResult
 from speechbridge.core.exceptions import ComponentException
 
 
+@lru_cache(maxsize=2)
+def _load_whisper_model(model_name: str, device: str) -> Any:
+    """
+    Load Whisper model (cached per process)
+
+    Repeated pipelines and retries reuse the loaded weights instead of
+    reading them from disk and re-initializing the device each time.
+
+    Args:
+        model_name: Whisper model size
+        device: Target device ('cuda', 'mps', 'cpu')
+
+    Returns:
+        Loaded Whisper model
+    """
+    import whisper
+
+    return whisper.load_model(model_name, device=device)
+
+
+# One lock per cached model: openai-whisper decoding installs kv-cache
+# hooks on the shared decoder, so concurrent decodes must not overlap
+_model_locks: Dict[tuple, threading.Lock] = {}
+_model_locks_guard = threading.Lock()
+
+
+def _get_model_lock(model_name: str, device: str) -> threading.Lock:
+    """
+    Get the lock guarding the cached model for (model_name, device)
+
+    Args:
+        model_name: Whisper model size
+        device: Target device ('cuda', 'mps', 'cpu')
+
+    Returns:
+        threading.Lock shared by every recognizer using that model
+    """
+    with _model_locks_guard:
+        return _model_locks.setdefault((model_name, device), threading.Lock())
+
+
+def _available_cpus() -> int:
+    """
+    Get number of CPUs this process may run on
+
+    Respects CPU affinity (taskset, container cpusets) where the platform
+    exposes it, unlike os.cpu_count().
+
+    Returns:
+        int: Usable CPU count (at least 1)
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
 class WhisperRecognizer(BaseSpeechRecognizer):
     """
     OpenAI Whisper speech recognizer
@@ -45,11 +105,15 @@ class WhisperRecognizer(BaseSpeechRecognizer):
                 - use_gpu: Use GPU if available (default: True)
                 - language: Source language (default: 'auto')
                 - task: 'transcribe' or 'translate' (default: 'transcribe')
+                - cpu_threads: Intra-op threads for CPU inference; setting it
+                  changes PyTorch's process-wide thread count (default:
+                  PyTorch's own setting)
         """
         super().__init__(config)
 
         self.model_name = self.config.get('model', 'base')
         self.task = self.config.get('task', 'transcribe')
+        self.cpu_threads = self.config.get('cpu_threads') or _available_cpus()
         self.model = None
 
         # Validate model name
@@ -69,7 +133,7 @@ class WhisperRecognizer(BaseSpeechRecognizer):
             return
 
         try:
-            import whisper
+            import whisper  # noqa: F401 - fail early with install hint
 
             self.logger.info(
                 f"Loading Whisper model '{self.model_name}' on {self.device}"
@@ -77,10 +141,8 @@ class WhisperRecognizer(BaseSpeechRecognizer):
 
             # Try loading on specified device
             try:
-                self.model = whisper.load_model(
-                    self.model_name,
-                    device=self.device
-                )
+                self.model = _load_whisper_model(self.model_name, self.device)
+                self._set_cpu_threads()
                 self._initialized = True
                 self.logger.info(f"Whisper model loaded successfully on {self.device}")
 
@@ -90,10 +152,8 @@ class WhisperRecognizer(BaseSpeechRecognizer):
                     self.logger.warning(f"MPS failed: {str(device_error)[:100]}...")
                     self.logger.info("Falling back to CPU for Whisper")
                     self.device = 'cpu'
-                    self.model = whisper.load_model(
-                        self.model_name,
-                        device='cpu'
-                    )
+                    self.model = _load_whisper_model(self.model_name, 'cpu')
+                    self._set_cpu_threads()
                     self._initialized = True
                     self.logger.info("Whisper model loaded successfully on CPU")
                 else:
@@ -110,6 +170,47 @@ class WhisperRecognizer(BaseSpeechRecognizer):
                 {'model': self.model_name, 'device': self.device}
             )
 
+    def _set_cpu_threads(self) -> None:
+        """
+        Apply an explicit cpu_threads setting to PyTorch
+
+        torch.set_num_threads() is process-global, so it is called only
+        when cpu_threads is configured; otherwise PyTorch keeps its
+        default (which honours OMP_NUM_THREADS).
+        """
+        if self.device != 'cpu' or not self.config.get('cpu_threads'):
+            return
+
+        import torch
+
+        if torch.get_num_threads() != self.cpu_threads:
+            torch.set_num_threads(self.cpu_threads)
+            self.logger.info(f"Using {self.cpu_threads} CPU threads for Whisper")
+
+    def warmup(self) -> None:
+        """
+        Load model and run one inference on 1 second of silence
+
+        CUDA kernels and the tokenizer are loaded here instead of during
+        the first real transcription.
+        """
+        if not self._initialized:
+            self.initialize()
+
+        try:
+            import numpy as np
+
+            with _get_model_lock(self.model_name, self.device):
+                self.model.transcribe(
+                    np.zeros(16000, dtype=np.float32),
+                    task=self.task,
+                    verbose=None,
+                    language=None if self.language == 'auto' else self.language
+                )
+            self.logger.info("Whisper model warmed up")
+        except Exception as e:
+            self.logger.warning(f"Whisper warmup failed: {e}")
+
     def transcribe(self, audio_path: str) -> TranscriptionResult:
         """
         Transcribe audio using Whisper
@@ -137,8 +238,10 @@ class WhisperRecognizer(BaseSpeechRecognizer):
             if self.language != 'auto':
                 options['language'] = self.language
 
-            # Perform transcription
-            result = self.model.transcribe(audio_path, **options)
+            # Perform transcription (the cached model is shared between
+            # recognizers, e.g. concurrent web jobs: one decode at a time)
+            with _get_model_lock(self.model_name, self.device):
+                result = self.model.transcribe(audio_path, **options)
 
             # Extract text and metadata
             transcription: TranscriptionResult = {
@@ -249,6 +352,7 @@ class WhisperRecognizer(BaseSpeechRecognizer):
         info.update({
             'model': self.model_name,
             'task': self.task,
+            'cpu_threads': self.cpu_threads,
             'num_supported_languages': len(self.SUPPORTED_LANGUAGES)
         })
         return info
@@ -5,9 +5,45 @@ Subtitle Generator
 Generate subtitles (SRT, VTT) from transcription and translation.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from pathlib import Path
+from functools import lru_cache
+from contextlib import ExitStack
 import logging
+import os
+
+
+# Write buffer for subtitle files (entries are written one by one)
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Timestamp millisecond separator and file header for each format
+SUBTITLE_FORMATS = {
+    'srt': (',', ''),
+    'vtt': ('.', 'WEBVTT\n\n'),
+}
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(seconds: float, separator: str) -> str:
+    """
+    Format timestamp as HH:MM:SS<separator>mmm
+
+    Works on integer milliseconds, so there is no float modulo and
+    values like 2.3s are not truncated to 2.299s. Cached because the
+    same segment boundaries are formatted for every subtitle file.
+
+    Args:
+        seconds: Time in seconds
+        separator: Separator before milliseconds (',' for SRT, '.' for VTT)
+
+    Returns:
+        str: Formatted timestamp
+    """
+    secs, millis = divmod(round(seconds * 1000), 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    return "%02d:%02d:%02d%s%03d" % (hours, minutes, secs, separator, millis)
 
 
 class SubtitleGenerator:
@@ -25,103 +61,55 @@ class SubtitleGenerator:
 
     def generate_srt(
         self,
-        segments: List[Dict[str, Any]],
-        texts: List[str],
+        segments: Iterable[Dict[str, Any]],
+        texts: Iterable[str],
         output_path: str
     ) -> str:
         """
         Generate SRT subtitle file
 
         Args:
-            segments: Whisper segments with timing
+            segments: Whisper segments with timing (list or iterator)
             texts: Text for each segment (original or translated)
             output_path: Path to save SRT file
 
         Returns:
             str: Path to generated SRT file
         """
-        if len(segments) != len(texts):
-            raise ValueError(
-                f"Segments count ({len(segments)}) doesn't match texts count ({len(texts)})"
-            )
-
-        srt_content = []
-
-        for i, (seg, text) in enumerate(zip(segments, texts), 1):
-            # Skip empty text
-            if not text.strip():
-                continue
+        output_files, count = self._write_subtitles(segments, [texts], [output_path], 'srt')
 
-            # Format timestamps
-            start_time = self._format_srt_timestamp(seg['start'])
-            end_time = self._format_srt_timestamp(seg['end'])
+        self.logger.info(f"Generated SRT with {count} entries: {output_path}")
 
-            # Add subtitle entry
-            srt_content.append(f"{i}")
-            srt_content.append(f"{start_time} --> {end_time}")
-            srt_content.append(text.strip())
-            srt_content.append("")  # Empty line between entries
-
-        # Write to file
-        output_file = Path(output_path)
-        output_file.write_text('\n'.join(srt_content), encoding='utf-8')
-
-        self.logger.info(f"Generated SRT with {len(segments)} entries: {output_path}")
-
-        return str(output_file)
+        return output_files[0]
 
     def generate_vtt(
         self,
-        segments: List[Dict[str, Any]],
-        texts: List[str],
+        segments: Iterable[Dict[str, Any]],
+        texts: Iterable[str],
         output_path: str
     ) -> str:
         """
         Generate VTT (WebVTT) subtitle file
 
         Args:
-            segments: Whisper segments with timing
+            segments: Whisper segments with timing (list or iterator)
             texts: Text for each segment (original or translated)
             output_path: Path to save VTT file
 
         Returns:
             str: Path to generated VTT file
         """
-        if len(segments) != len(texts):
-            raise ValueError(
-                f"Segments count ({len(segments)}) doesn't match texts count ({len(texts)})"
-            )
-
-        vtt_content = ["WEBVTT", ""]
-
-        for i, (seg, text) in enumerate(zip(segments, texts), 1):
-            # Skip empty text
-            if not text.strip():
-                continue
-
-            # Format timestamps
-            start_time = self._format_vtt_timestamp(seg['start'])
-            end_time = self._format_vtt_timestamp(seg['end'])
+        output_files, count = self._write_subtitles(segments, [texts], [output_path], 'vtt')
 
-            # Add subtitle entry
-            vtt_content.append(f"{i}")
-            vtt_content.append(f"{start_time} --> {end_time}")
-            vtt_content.append(text.strip())
-            vtt_content.append("")  # Empty line between entries
+        self.logger.info(f"Generated VTT with {count} entries: {output_path}")
 
-        # Write to file
-        output_file = Path(output_path)
-        output_file.write_text('\n'.join(vtt_content), encoding='utf-8')
-
-        self.logger.info(f"Generated VTT with {len(segments)} entries: {output_path}")
-
-        return str(output_file)
+        return output_files[0]
 
     def generate_dual_subtitles(
         self,
-        segments: List[Dict[str, Any]],
-        original_texts: List[str],
-        translated_texts: List[str],
+        segments: Iterable[Dict[str, Any]],
+        original_texts: Iterable[str],
+        translated_texts: Iterable[str],
         output_path_original: str,
         output_path_translated: str,
         format: str = 'srt'
@@ -129,8 +117,12 @@ class SubtitleGenerator:
         """
         Generate both original and translated subtitle files
 
+        Both files are written in a single pass over the segments, so
+        each timestamp is formatted once. Inputs may be generators; they
+        are consumed lazily and never materialized.
+
         Args:
-            segments: Whisper segments with timing
+            segments: Whisper segments with timing (list or iterator)
             original_texts: Original text for each segment
             translated_texts: Translated text for each segment
             output_path_original: Path for original subtitles
@@ -140,24 +132,13 @@ class SubtitleGenerator:
         Returns:
             Dict with paths to both subtitle files
         """
-        result = {}
-
-        if format.lower() == 'srt':
-            result['original'] = self.generate_srt(
-                segments, original_texts, output_path_original
-            )
-            result['translated'] = self.generate_srt(
-                segments, translated_texts, output_path_translated
-            )
-        elif format.lower() == 'vtt':
-            result['original'] = self.generate_vtt(
-                segments, original_texts, output_path_original
-            )
-            result['translated'] = self.generate_vtt(
-                segments, translated_texts, output_path_translated
-            )
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+        (original, translated), _ = self._write_subtitles(
+            segments,
+            [original_texts, translated_texts],
+            [output_path_original, output_path_translated],
+            format.lower()
+        )
+        result = {'original': original, 'translated': translated}
 
         self.logger.info(
             f"Generated dual subtitles: original={result['original']}, "
@@ -166,6 +147,118 @@ class SubtitleGenerator:
 
         return result
 
+    def _write_subtitles(
+        self,
+        segments: Iterable[Dict[str, Any]],
+        texts_per_file: List[Iterable[str]],
+        output_paths: List[str],
+        format: str
+    ) -> Tuple[List[str], int]:
+        """
+        Write one or more subtitle files sharing the same segment timing
+
+        Entries are streamed into buffered files in a single pass over
+        the segments; timestamps are formatted once per segment no matter
+        how many files are written. Files are written under a temporary
+        name and moved into place with os.replace() once complete, so a
+        failed run never leaves a truncated subtitle file behind. This also
+        lets segments and texts be lazy iterators: a length mismatch found
+        part-way through aborts the write without touching the outputs.
+
+        Args:
+            segments: Whisper segments with timing
+            texts_per_file: Texts for each segment, one list per output file
+            output_paths: Output file paths (same order as texts_per_file)
+            format: Subtitle format ('srt' or 'vtt')
+
+        Returns:
+            Tuple of (paths to generated files, number of segments)
+        """
+        if format not in SUBTITLE_FORMATS:
+            raise ValueError(f"Unsupported format: {format}")
+
+        separator, header = SUBTITLE_FORMATS[format]
+        output_files = [Path(path) for path in output_paths]
+        temp_files = [path.with_name(path.name + '.tmp') for path in output_files]
+
+        try:
+            count = self._write_entries(segments, texts_per_file, temp_files, separator, header)
+
+            for temp_file, output_file in zip(temp_files, output_files):
+                os.replace(temp_file, output_file)
+
+        except BaseException:
+            for temp_file in temp_files:
+                temp_file.unlink(missing_ok=True)
+            raise
+
+        return [str(path) for path in output_files], count
+
+    def _write_entries(
+        self,
+        segments: Iterable[Dict[str, Any]],
+        texts_per_file: List[Iterable[str]],
+        paths: List[Path],
+        separator: str,
+        header: str
+    ) -> int:
+        """
+        Stream subtitle entries into the given files
+
+        Args:
+            segments: Whisper segments with timing
+            texts_per_file: Texts for each segment, one list per file
+            paths: Files to write (same order as texts_per_file)
+            separator: Millisecond separator for timestamps
+            header: Text written at the start of each file
+
+        Returns:
+            int: Number of segments written
+
+        Raises:
+            ValueError: If segments and texts differ in length
+        """
+        with ExitStack() as stack:
+            files = [
+                stack.enter_context(
+                    open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+                )
+                for path in paths
+            ]
+
+            # Bind per-entry lookups to locals for the hot loop
+            writers = [f.write for f in files]
+            fmt = _format_timestamp
+
+            for write in writers:
+                write(header)
+
+            i = 0
+            entries = zip(segments, *texts_per_file, strict=True)
+            try:
+                for i, (seg, *texts) in enumerate(entries, 1):
+                    start_time = None
+
+                    for write, text in zip(writers, texts):
+                        text = text.strip()
+
+                        # Skip empty text
+                        if not text:
+                            continue
+
+                        # Format timestamps once per segment
+                        if start_time is None:
+                            start_time = fmt(seg['start'], separator)
+                            end_time = fmt(seg['end'], separator)
+
+                        # One write per subtitle entry (blank line between entries)
+                        write(f"{i}\n{start_time} --> {end_time}\n{text}\n\n")
+            except ValueError as e:
+                # Raised by zip(strict=True) once one input runs out early
+                raise ValueError(f"Segments count doesn't match texts count: {e}") from e
+
+        return i
+
     def _format_srt_timestamp(self, seconds: float) -> str:
         """
         Format timestamp for SRT format
@@ -176,12 +269,7 @@ class SubtitleGenerator:
         Returns:
             str: Formatted timestamp (HH:MM:SS,mmm)
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+        return _format_timestamp(seconds, ',')
 
     def _format_vtt_timestamp(self, seconds: float) -> str:
         """
@@ -193,9 +281,4 @@ class SubtitleGenerator:
         Returns:
             str: Formatted timestamp (HH:MM:SS.mmm)
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+        return _format_timestamp(seconds, '.')
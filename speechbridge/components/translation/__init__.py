@@ -6,7 +6,10 @@ Translation engines for multilingual support.
 """
 
 from .base import BaseTranslator
+from .cache import TranslationCache, CachedTranslator
 
 __all__ = [
     'BaseTranslator',
+    'TranslationCache',
+    'CachedTranslator',
 ]
@@ -7,6 +7,7 @@ Abstract base class for all translation engines.
 
 from typing import Dict, Any, List, Optional
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 from speechbridge.core.base import BaseProcessor
 from speechbridge.core.types import TranslationResult
@@ -30,12 +31,14 @@ class BaseTranslator(BaseProcessor):
                 - target_lang: Target language code (required)
                 - preserve_formatting: Keep text formatting (default: True)
                 - use_gpu: Use GPU if available (default: True)
+                - max_workers: Parallel requests in translate_batch (default: 8)
         """
         super().__init__(config)
 
         self.source_lang = self.config.get('source_lang', 'auto')
         self.target_lang = self.config.get('target_lang', 'en')
         self.preserve_formatting = self.config.get('preserve_formatting', True)
+        self.max_workers = self.config.get('max_workers', 8)
 
     @abstractmethod
     def initialize(self) -> None:
@@ -75,8 +78,9 @@ class BaseTranslator(BaseProcessor):
         """
         Translate multiple texts
 
-        Default implementation translates one by one.
-        Override for batch optimization.
+        Default implementation translates texts concurrently in a thread
+        pool (translation is I/O-bound), preserving input order.
+        Override for native batch APIs.
 
         Args:
             texts: List of texts to translate
@@ -86,10 +90,21 @@ class BaseTranslator(BaseProcessor):
         Returns:
             List[TranslationResult]: List of translations
         """
-        return [
-            self.translate(text, source_lang, target_lang)
-            for text in texts
-        ]
+        if len(texts) <= 1 or self.max_workers <= 1:
+            return [
+                self.translate(text, source_lang, target_lang)
+                for text in texts
+            ]
+
+        # Initialize once up front so workers don't race on it
+        if not self._initialized:
+            self.initialize()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(texts))) as executor:
+            return list(executor.map(
+                lambda text: self.translate(text, source_lang, target_lang),
+                texts
+            ))
 
     @abstractmethod
     def get_supported_languages(self) -> Dict[str, List[str]]:
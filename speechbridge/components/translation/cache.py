@@ -0,0 +1,328 @@
+"""
+Translation Cache
+=================
+
+Persistent translation cache keyed by segment text, so repeated lines
+(intros, outros, identical segments, re-runs) are not sent to the
+translation engine again.
+"""
+
+from typing import Dict, Any, List, Optional
+from pathlib import Path
+import hashlib
+import sqlite3
+import threading
+import time
+
+from .base import BaseTranslator
+from speechbridge.core.types import TranslationResult
+
+
+class TranslationCache:
+    """
+    SQLite-backed translation cache
+
+    Entries are keyed by (engine, source language, target language,
+    SHA-1 of the text) and expire after an optional TTL. Safe to share
+    between threads.
+    """
+
+    # Engine settings that change the translation, part of the engine key
+    ENGINE_SETTINGS = ('model', 'model_name', 'formality')
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Initialize translation cache
+
+        Args:
+            path: SQLite database file (created if missing)
+            ttl: Entry lifetime in seconds (default: None, never expires)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations ("
+            " engine TEXT NOT NULL,"
+            " source_lang TEXT NOT NULL,"
+            " target_lang TEXT NOT NULL,"
+            " text_hash TEXT NOT NULL,"
+            " translation TEXT NOT NULL,"
+            " detected_lang TEXT,"
+            " created REAL NOT NULL,"
+            " confidence REAL,"
+            " PRIMARY KEY (engine, source_lang, target_lang, text_hash))"
+        )
+
+        # Caches created before confidence was stored
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(translations)")}
+        if 'confidence' not in columns:
+            self._conn.execute("ALTER TABLE translations ADD COLUMN confidence REAL")
+        self._conn.commit()
+
+    @classmethod
+    def engine_key(cls, translator: BaseTranslator) -> str:
+        """
+        Build engine name for cache keys
+
+        Args:
+            translator: Translation engine
+
+        Returns:
+            str: Class name plus the ENGINE_SETTINGS the translator sets,
+            e.g. 'DeepLTranslator[formality=less]'
+        """
+        settings = [
+            f"{name}={getattr(translator, name)}"
+            for name in cls.ENGINE_SETTINGS
+            if getattr(translator, name, None) is not None
+        ]
+        name = translator.__class__.__name__
+        return f"{name}[{','.join(settings)}]" if settings else name
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        """SHA-1 hex digest of text"""
+        return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def get_many(
+        self,
+        engine: str,
+        source_lang: str,
+        target_lang: str,
+        texts: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up cached translations
+
+        Args:
+            engine: Translation engine name
+            source_lang: Source language
+            target_lang: Target language
+            texts: Texts to look up
+
+        Returns:
+            Dict mapping each cached text to {'text', 'source_lang',
+            'confidence'} (confidence None if it was not stored)
+        """
+        hashes = {self._hash(text): text for text in texts}
+        if not hashes:
+            return {}
+
+        min_created = time.time() - self.ttl if self.ttl else 0.0
+        found = {}
+
+        with self._lock:
+            # Stay well below SQLite's bound-parameter limit
+            keys = list(hashes)
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self._conn.execute(
+                    "SELECT text_hash, translation, detected_lang, confidence FROM translations"
+                    " WHERE engine = ? AND source_lang = ? AND target_lang = ?"
+                    " AND created >= ?"
+                    f" AND text_hash IN ({','.join('?' * len(chunk))})",
+                    (engine, source_lang, target_lang, min_created, *chunk)
+                )
+                for text_hash, translation, detected_lang, confidence in rows:
+                    found[hashes[text_hash]] = {
+                        'text': translation,
+                        'source_lang': detected_lang or source_lang,
+                        'confidence': confidence
+                    }
+
+        return found
+
+    def put_many(
+        self,
+        engine: str,
+        source_lang: str,
+        target_lang: str,
+        results: Dict[str, TranslationResult]
+    ) -> None:
+        """
+        Store translations
+
+        Args:
+            engine: Translation engine name
+            source_lang: Source language
+            target_lang: Target language
+            results: Translation result for each source text
+        """
+        if not results:
+            return
+
+        now = time.time()
+        rows = [
+            (engine, source_lang, target_lang, self._hash(text),
+             result['text'], result.get('source_lang'), now, result.get('confidence'))
+            for text, result in results.items()
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations"
+                " (engine, source_lang, target_lang, text_hash,"
+                " translation, detected_lang, created, confidence)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached translations"""
+        with self._lock:
+            self._conn.execute("DELETE FROM translations")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedTranslator(BaseTranslator):
+    """
+    Translator wrapper that checks a TranslationCache first
+
+    Only texts missing from the cache reach the wrapped translator;
+    repeated texts within one batch are translated once.
+    """
+
+    def __init__(self, translator: BaseTranslator, cache: TranslationCache):
+        """
+        Initialize cached translator
+
+        Args:
+            translator: Translation engine to wrap
+            cache: Translation cache
+        """
+        super().__init__(translator.config)
+
+        self.translator = translator
+        self.cache = cache
+        self.engine = cache.engine_key(translator)
+
+        # Same language defaults as the wrapped engine
+        self.source_lang = translator.source_lang
+        self.target_lang = translator.target_lang
+
+    def initialize(self) -> None:
+        """Initialize the wrapped translator"""
+        if self._initialized:
+            return
+
+        self.translator.initialize()
+        self._initialized = True
+
+    def translate(
+        self,
+        text: str,
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None
+    ) -> TranslationResult:
+        """
+        Translate text, using the cache when possible
+
+        Args:
+            text: Text to translate
+            source_lang: Source language (overrides config)
+            target_lang: Target language (overrides config)
+
+        Returns:
+            TranslationResult: Translation with metadata
+        """
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: Optional[str] = None,
+        target_lang: Optional[str] = None
+    ) -> List[TranslationResult]:
+        """
+        Translate multiple texts, using the cache when possible
+
+        Args:
+            texts: List of texts to translate
+            source_lang: Source language (overrides config)
+            target_lang: Target language (overrides config)
+
+        Returns:
+            List[TranslationResult]: List of translations
+        """
+        src_lang = source_lang or self.source_lang
+        tgt_lang = target_lang or self.target_lang
+
+        cached = self.cache.get_many(self.engine, src_lang, tgt_lang, texts)
+
+        # Unique misses, in first-seen order
+        missing = list(dict.fromkeys(text for text in texts if text not in cached))
+
+        if missing:
+            translated = self.translator.translate_batch(missing, source_lang, target_lang)
+            fresh = dict(zip(missing, translated, strict=True))
+
+            # Failed texts come back untranslated: don't cache those
+            self.cache.put_many(self.engine, src_lang, tgt_lang, {
+                text: result for text, result in fresh.items()
+                if 'error' not in result.get('metadata', {})
+            })
+        else:
+            fresh = {}
+
+        self.logger.debug(
+            f"Translation cache: {len(cached)} cached, {len(missing)} translated"
+        )
+
+        results = []
+        for text in texts:
+            if text in fresh:
+                results.append(fresh[text])
+            else:
+                hit = cached[text]
+                result: TranslationResult = {
+                    'text': hit['text'],
+                    'source_lang': hit['source_lang'],
+                    'target_lang': tgt_lang
+                }
+                if hit['confidence'] is not None:
+                    result['confidence'] = hit['confidence']
+                results.append(result)
+
+        return results
+
+    def get_supported_languages(self) -> Dict[str, List[str]]:
+        """
+        Get supported languages of the wrapped translator
+
+        Returns:
+            Dict with 'source' and 'target' language lists
+        """
+        return self.translator.get_supported_languages()
+
+    def validate_config(self) -> bool:
+        """
+        Validate the wrapped translator configuration
+
+        Returns:
+            bool: True if configuration is valid
+        """
+        return self.translator.validate_config()
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get cached translator information
+
+        Returns:
+            Dict: Wrapped translator info with cache details
+        """
+        info = self.translator.get_info()
+        info.update({
+            'cache_path': str(self.cache.path),
+            'cache_ttl': self.cache.ttl
+        })
+        return info
@@ -6,6 +6,8 @@ Professional-quality translation using DeepL API.
 """
 
 from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 import os
 
 from .base import BaseTranslator
@@ -36,6 +38,9 @@ class DeepLTranslator(BaseTranslator):
         'uk', 'zh'
     ]
 
+    # Maximum number of texts DeepL accepts in one request
+    MAX_BATCH_TEXTS = 50
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize DeepL translator
@@ -47,11 +52,13 @@ class DeepLTranslator(BaseTranslator):
                 - target_lang: Target language (required)
                 - formality: 'default', 'more', or 'less' (default: 'default')
                 - preserve_formatting: Keep formatting (default: True)
+                - max_workers: Concurrent batch requests in translate_batch (default: 4)
         """
         super().__init__(config)
 
         self.api_key = self.config.get('api_key') or os.getenv('DEEPL_API_KEY')
         self.formality = self.config.get('formality', 'default')
+        self.max_workers = self.config.get('max_workers', 4)
         self.translator = None
 
     def initialize(self) -> None:
@@ -122,7 +129,7 @@ class DeepLTranslator(BaseTranslator):
         tgt_lang = target_lang or self.target_lang
 
         try:
-            self.logger.info(f"Translating {src_lang} -> {tgt_lang}: {len(text)} chars")
+            self.logger.debug(f"Translating {src_lang} -> {tgt_lang}: {len(text)} chars")
 
             # Prepare translation options
             options = {
@@ -149,7 +156,7 @@ class DeepLTranslator(BaseTranslator):
                 'confidence': 1.0  # DeepL doesn't provide confidence scores
             }
 
-            self.logger.info(
+            self.logger.debug(
                 f"Translation complete: {len(translation['text'])} chars"
             )
 
@@ -170,6 +177,12 @@ class DeepLTranslator(BaseTranslator):
         """
         Translate multiple texts in batch (more efficient)
 
+        Texts are sent in requests of up to MAX_BATCH_TEXTS, so N segments
+        cost ceil(N/50) round-trips instead of N; up to max_workers requests
+        are in flight at once. If a batch request fails, its texts are
+        retried one by one. Texts that still fail keep their original text
+        with metadata['error'] set; the call raises only if every text failed.
+
         Args:
             texts: List of texts to translate
             source_lang: Source language (overrides config)
@@ -201,19 +214,38 @@ class DeepLTranslator(BaseTranslator):
             if self.formality != 'default':
                 options['formality'] = self.formality
 
-            # Perform batch translation
-            results = self.translator.translate_text(texts, **options)
-
-            # Convert to TranslationResult list
-            translations = []
-            for result in results:
-                translation: TranslationResult = {
-                    'text': result.text,
-                    'source_lang': result.detected_source_lang.lower() if hasattr(result, 'detected_source_lang') else src_lang,
-                    'target_lang': tgt_lang,
-                    'confidence': 1.0
-                }
-                translations.append(translation)
+            chunks = [
+                texts[start:start + self.MAX_BATCH_TEXTS]
+                for start in range(0, len(texts), self.MAX_BATCH_TEXTS)
+            ]
+
+            def translate_chunk(chunk: List[str]) -> List[TranslationResult]:
+                # A failing chunk must not discard the chunks that succeeded
+                try:
+                    return self._translate_chunk(chunk, options, src_lang, tgt_lang)
+                except Exception as e:
+                    self.logger.error(f"Failed to translate chunk of {len(chunk)} texts: {e}")
+                    return [self._failed_result(text, src_lang, tgt_lang, e) for text in chunk]
+
+            # Chunk requests are independent round-trips: overlap them
+            if len(chunks) <= 1 or self.max_workers <= 1:
+                chunk_results = map(translate_chunk, chunks)
+            else:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+                    chunk_results = list(executor.map(translate_chunk, chunks))
+
+            translations = list(chain.from_iterable(chunk_results))
+
+            failed = sum(1 for result in translations if 'error' in result.get('metadata', {}))
+            if failed:
+                if failed == len(translations):
+                    raise ComponentException(
+                        f"All {failed} texts failed to translate",
+                        {'error': translations[0]['metadata']['error']}
+                    )
+                self.logger.warning(
+                    f"{failed}/{len(translations)} texts failed to translate, kept untranslated"
+                )
 
             self.logger.info(f"Batch translation complete: {len(translations)} results")
 
@@ -225,6 +257,90 @@ class DeepLTranslator(BaseTranslator):
                 {'num_texts': len(texts), 'source': src_lang, 'target': tgt_lang}
             )
 
+    def _translate_chunk(
+        self,
+        chunk: List[str],
+        options: Dict[str, Any],
+        src_lang: str,
+        tgt_lang: str
+    ) -> List[TranslationResult]:
+        """
+        Translate one chunk of texts in a single request
+
+        Args:
+            chunk: Up to MAX_BATCH_TEXTS texts
+            options: DeepL translate_text options
+            src_lang: Source language
+            tgt_lang: Target language
+
+        Returns:
+            List[TranslationResult]: Translations in chunk order
+        """
+        try:
+            results = self.translator.translate_text(chunk, **options)
+        except Exception as e:
+            self.logger.warning(
+                f"Batch request failed ({e}), translating {len(chunk)} texts individually"
+            )
+            return [self._translate_single(text, src_lang, tgt_lang) for text in chunk]
+
+        # Convert to TranslationResult list
+        return [
+            {
+                'text': result.text,
+                'source_lang': result.detected_source_lang.lower() if hasattr(result, 'detected_source_lang') else src_lang,
+                'target_lang': tgt_lang,
+                'confidence': 1.0
+            }
+            for result in results
+        ]
+
+    def _translate_single(self, text: str, src_lang: str, tgt_lang: str) -> TranslationResult:
+        """
+        Translate one text, marking it failed instead of raising
+
+        Args:
+            text: Text to translate
+            src_lang: Source language
+            tgt_lang: Target language
+
+        Returns:
+            TranslationResult: Translation, or the original text with
+            metadata['error'] set if translation failed
+        """
+        try:
+            return self.translate(text, src_lang, tgt_lang)
+        except Exception as e:
+            self.logger.error(f"Failed to translate text ({len(text)} chars): {e}")
+            return self._failed_result(text, src_lang, tgt_lang, e)
+
+    @staticmethod
+    def _failed_result(
+        text: str,
+        src_lang: str,
+        tgt_lang: str,
+        error: Exception
+    ) -> TranslationResult:
+        """
+        Build result for a text that could not be translated
+
+        Args:
+            text: Original text (kept as the result text)
+            src_lang: Source language
+            tgt_lang: Target language
+            error: Translation error
+
+        Returns:
+            TranslationResult: Original text with metadata['error'] set
+        """
+        return {
+            'text': text,
+            'source_lang': src_lang,
+            'target_lang': tgt_lang,
+            'confidence': 0.0,
+            'metadata': {'error': str(error)}
+        }
+
     def get_supported_languages(self) -> Dict[str, List[str]]:
         """
         Get supported languages
@@ -6,7 +6,10 @@ Text-to-speech engines for voice synthesis.
 """
 
 from .base import BaseTTS
+from .cache import TTSCache, CachedTTS
 
 __all__ = [
     'BaseTTS',
+    'TTSCache',
+    'CachedTTS',
 ]
@@ -8,6 +8,7 @@ Abstract base class for all TTS engines.
 from typing import Dict, Any, List, Optional
 from abc import abstractmethod
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from speechbridge.core.base import BaseProcessor
 from speechbridge.core.types import TTSResult
@@ -33,6 +34,7 @@ class BaseTTS(BaseProcessor):
                 - pitch: Pitch adjustment (default: 0)
                 - volume: Volume level 0-100 (default: 100)
                 - use_gpu: Use GPU if available (default: True)
+                - max_workers: Parallel syntheses in synthesize_batch (default: 8)
         """
         super().__init__(config)
 
@@ -41,6 +43,7 @@ class BaseTTS(BaseProcessor):
         self.rate = self.config.get('rate', 1.0)
         self.pitch = self.config.get('pitch', 0)
         self.volume = self.config.get('volume', 100)
+        self.max_workers = self.config.get('max_workers', 8)
 
     @abstractmethod
     def initialize(self) -> None:
@@ -83,8 +86,8 @@ class BaseTTS(BaseProcessor):
         """
         Synthesize multiple texts
 
-        Default implementation synthesizes one by one.
-        Override for batch optimization.
+        Default implementation synthesizes texts concurrently in a thread
+        pool, preserving input order. Override for batch optimization.
 
         Args:
             texts: List of texts to synthesize
@@ -98,13 +101,27 @@ class BaseTTS(BaseProcessor):
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True, parents=True)
 
-        results = []
-        for i, text in enumerate(texts):
-            file_path = output_path / f"speech_{i:04d}.wav"
-            result = self.synthesize(text, str(file_path), voice, language)
-            results.append(result)
-
-        return results
+        file_paths = [
+            str(output_path / f"speech_{i:04d}.wav")
+            for i in range(len(texts))
+        ]
+
+        if len(texts) <= 1 or self.max_workers <= 1:
+            return [
+                self.synthesize(text, file_path, voice, language)
+                for text, file_path in zip(texts, file_paths)
+            ]
+
+        # Initialize once up front so workers don't race on it
+        if not self._initialized:
+            self.initialize()
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(texts))) as executor:
+            return list(executor.map(
+                lambda text, file_path: self.synthesize(text, file_path, voice, language),
+                texts,
+                file_paths
+            ))
 
     @abstractmethod
     def get_available_voices(self, language: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -0,0 +1,238 @@
+"""
+TTS Cache
+=========
+
+Persistent speech cache keyed by text and voice settings, so repeated
+lines (intros, outros, identical segments, re-runs) are not sent to the
+TTS engine again.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+from pathlib import Path
+import hashlib
+import sqlite3
+import threading
+import time
+
+from .base import BaseTTS
+from speechbridge.core.types import TTSResult
+
+
+class TTSCache:
+    """
+    SQLite-backed synthesized speech cache
+
+    Audio is stored as a BLOB next to its duration and voice, keyed by
+    a SHA-1 of the engine, voice settings and text. Entries expire after
+    an optional TTL. Safe to share between threads.
+    """
+
+    # Bump to invalidate all entries after a change in synthesis output
+    KEY_VERSION = 'tts:v1'
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Initialize TTS cache
+
+        Args:
+            path: SQLite database file (created if missing)
+            ttl: Entry lifetime in seconds (default: None, never expires)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(exist_ok=True, parents=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS speech ("
+            " key TEXT PRIMARY KEY,"
+            " audio BLOB NOT NULL,"
+            " duration REAL NOT NULL,"
+            " voice TEXT,"
+            " created REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def make_key(cls, *parts: Any) -> str:
+        """
+        Build cache key from engine, voice settings and text
+
+        Args:
+            *parts: Values that affect the synthesized audio
+
+        Returns:
+            str: SHA-1 hex digest
+        """
+        raw = '|'.join([cls.KEY_VERSION, *(str(part) for part in parts)])
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float, Optional[str]]]:
+        """
+        Look up cached speech
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Tuple of (audio bytes, duration, voice) or None if missing
+        """
+        min_created = time.time() - self.ttl if self.ttl else 0.0
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT audio, duration, voice FROM speech"
+                " WHERE key = ? AND created >= ?",
+                (key, min_created)
+            ).fetchone()
+
+        return row
+
+    def put(self, key: str, audio: bytes, duration: float, voice: Optional[str]) -> None:
+        """
+        Store synthesized speech
+
+        Args:
+            key: Cache key from make_key()
+            audio: Encoded audio file contents
+            duration: Audio duration in seconds
+            voice: Voice used for synthesis
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO speech VALUES (?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(audio), duration, voice, time.time())
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all cached speech"""
+        with self._lock:
+            self._conn.execute("DELETE FROM speech")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedTTS(BaseTTS):
+    """
+    TTS wrapper that checks a TTSCache first
+
+    Only texts missing from the cache reach the wrapped engine; cached
+    audio is written straight to the requested output path.
+    """
+
+    def __init__(self, tts_engine: BaseTTS, cache: TTSCache):
+        """
+        Initialize cached TTS
+
+        Args:
+            tts_engine: TTS engine to wrap
+            cache: TTS cache
+        """
+        super().__init__(tts_engine.config)
+
+        self.tts_engine = tts_engine
+        self.cache = cache
+        self.engine = tts_engine.__class__.__name__
+
+        # Same voice defaults as the wrapped engine
+        self.voice = tts_engine.voice
+        self.language = tts_engine.language
+
+    def initialize(self) -> None:
+        """Initialize the wrapped TTS engine"""
+        if self._initialized:
+            return
+
+        self.tts_engine.initialize()
+        self._initialized = True
+
+    def synthesize(
+        self,
+        text: str,
+        output_path: str,
+        voice: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> TTSResult:
+        """
+        Synthesize speech, using the cache when possible
+
+        Args:
+            text: Text to synthesize
+            output_path: Path to save audio file
+            voice: Voice name (overrides config)
+            language: Language code (overrides config)
+
+        Returns:
+            TTSResult: Synthesis result with metadata
+        """
+        engine = self.tts_engine
+        key = self.cache.make_key(
+            self.engine, voice or engine.voice, language or engine.language,
+            engine.rate, engine.pitch, engine.volume, text
+        )
+
+        hit = self.cache.get(key)
+        if hit is not None:
+            audio, duration, cached_voice = hit
+            Path(output_path).write_bytes(audio)
+
+            self.logger.debug(f"TTS cache hit: {len(text)} chars")
+
+            return {
+                'audio_path': output_path,
+                'duration': duration,
+                'voice': cached_voice or voice or engine.voice,
+                'language': language or engine.language,
+                'text_length': len(text)
+            }
+
+        result = engine.synthesize(text, output_path, voice, language)
+        self.cache.put(
+            key,
+            Path(result['audio_path']).read_bytes(),
+            result['duration'],
+            result.get('voice')
+        )
+
+        return result
+
+    def get_available_voices(self, language: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get available voices of the wrapped engine
+
+        Args:
+            language: Filter by language (optional)
+
+        Returns:
+            List of voice info dictionaries
+        """
+        return self.tts_engine.get_available_voices(language)
+
+    def validate_config(self) -> bool:
+        """
+        Validate the wrapped engine configuration
+
+        Returns:
+            bool: True if configuration is valid
+        """
+        return self.tts_engine.validate_config()
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get cached TTS information
+
+        Returns:
+            Dict: Wrapped engine info with cache details
+        """
+        info = self.tts_engine.get_info()
+        info.update({
+            'cache_path': str(self.cache.path),
+            'cache_ttl': self.cache.ttl
+        })
+        return info
@@ -12,6 +12,7 @@ import asyncio
 from .base import BaseTTS
 from speechbridge.core.types import TTSResult
 from speechbridge.core.exceptions import ComponentException
+from speechbridge.utils.audio import get_wav_duration
 
 
 class EdgeTTS(BaseTTS):
@@ -147,7 +148,7 @@ class EdgeTTS(BaseTTS):
             voice_name = self.voice
 
         try:
-            self.logger.info(f"Synthesizing with {voice_name}: {len(text)} chars")
+            self.logger.debug(f"Synthesizing with {voice_name}: {len(text)} chars")
 
             # Run async synthesis
             asyncio.run(self._synthesize_async(text, output_path, voice_name))
@@ -164,7 +165,7 @@ class EdgeTTS(BaseTTS):
                 'text_length': len(text)
             }
 
-            self.logger.info(f"Synthesis complete: {duration:.2f}s audio")
+            self.logger.debug(f"Synthesis complete: {duration:.2f}s audio")
 
             return result
 
@@ -268,8 +269,13 @@ class EdgeTTS(BaseTTS):
         Returns:
             float: Duration in seconds
         """
+        # WAV header first: no process spawn for PCM output
+        duration = get_wav_duration(audio_path)
+        if duration is not None:
+            return duration
+
         try:
-            # Try using ffprobe first (works for all formats)
+            # Fall back to ffprobe (works for all formats, e.g. MP3 stream)
             import subprocess
             result = subprocess.run(
                 [
@@ -287,13 +293,8 @@ class EdgeTTS(BaseTTS):
             if result.returncode == 0 and result.stdout.strip():
                 return float(result.stdout.strip())
 
-            # Fallback to wave module for WAV files
-            import wave
-            with wave.open(audio_path, 'rb') as audio:
-                frames = audio.getnframes()
-                rate = audio.getframerate()
-                duration = frames / float(rate)
-                return duration
+            self.logger.warning(f"Could not get audio duration: {result.stderr.strip()}")
+            return 0.0
 
         except Exception as e:
             self.logger.warning(f"Could not get audio duration: {e}")
@@ -0,0 +1,225 @@
+"""
+Piper TTS
+=========
+
+Local text-to-speech with Piper voices (ONNX Runtime, no network).
+"""
+
+from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from pathlib import Path
+import os
+import wave
+
+from .base import BaseTTS
+from speechbridge.core.types import TTSResult
+from speechbridge.core.exceptions import ComponentException
+from speechbridge.utils.audio import get_wav_duration
+
+
+@lru_cache(maxsize=4)
+def _load_piper_voice(model_path: str, use_cuda: bool) -> Any:
+    """
+    Load Piper voice model (cached per process)
+
+    Args:
+        model_path: Path to the voice .onnx file (its .onnx.json config
+            must sit next to it)
+        use_cuda: Run ONNX Runtime on CUDA
+
+    Returns:
+        piper.PiperVoice
+    """
+    from piper import PiperVoice
+
+    return PiperVoice.load(model_path, use_cuda=use_cuda)
+
+
+class PiperTTS(BaseTTS):
+    """
+    Piper TTS engine
+
+    Synthesizes speech locally from a preloaded Piper voice, so there is
+    no per-segment network round-trip or rate limit. Each voice model
+    speaks one language; pass a different model for other languages.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize Piper TTS
+
+        Args:
+            config: Configuration with parameters:
+                - model: Path to voice .onnx file (default: PIPER_MODEL env var)
+                - language: Language code of the voice (default: 'en')
+                - rate: Speech rate (default: 1.0)
+                - volume: Volume level (default: 100)
+                - speaker_id: Speaker of a multi-speaker voice (default: None)
+                - use_gpu: Use CUDA if available (default: True)
+        """
+        super().__init__(config)
+
+        self.model_path = self.config.get('model') or os.getenv('PIPER_MODEL')
+        self.speaker_id = self.config.get('speaker_id')
+        self.piper_voice = None
+
+    def _get_default_voice(self) -> str:
+        """
+        Get default voice for Piper TTS
+
+        Returns:
+            str: Voice name (model file name without extension)
+        """
+        model_path = self.config.get('model') or os.getenv('PIPER_MODEL')
+        return Path(model_path).stem if model_path else 'default'
+
+    def initialize(self) -> None:
+        """
+        Initialize Piper TTS
+
+        Loads the voice model once; synthesis then runs fully offline
+        """
+        if self._initialized:
+            return
+
+        if not self.model_path:
+            raise ComponentException(
+                "Piper voice model is required",
+                {'solution': 'Set PIPER_MODEL env var or provide model in config'}
+            )
+
+        try:
+            self.logger.info(f"Loading Piper voice: {self.model_path}")
+
+            self.piper_voice = _load_piper_voice(self.model_path, self.device == 'cuda')
+
+            self._initialized = True
+            self.logger.info("Piper TTS initialized")
+
+        except ImportError:
+            raise ComponentException(
+                "Piper TTS library not installed",
+                {'solution': 'pip install piper-tts'}
+            )
+        except Exception as e:
+            raise ComponentException(
+                f"Failed to load Piper voice: {e}",
+                {'model': self.model_path}
+            )
+
+    def synthesize(
+        self,
+        text: str,
+        output_path: str,
+        voice: Optional[str] = None,
+        language: Optional[str] = None
+    ) -> TTSResult:
+        """
+        Synthesize speech using Piper
+
+        Args:
+            text: Text to synthesize
+            output_path: Path to save WAV file
+            voice: Ignored (the voice is fixed by the loaded model)
+            language: Language code (only reported in the result)
+
+        Returns:
+            TTSResult: Synthesis result with metadata
+        """
+        # Ensure engine is initialized
+        if not self._initialized:
+            self.initialize()
+
+        try:
+            self.logger.debug(f"Synthesizing with Piper: {len(text)} chars")
+
+            with wave.open(output_path, 'wb') as wav_file:
+                self._synthesize_wav(text, wav_file)
+
+            # Piper writes PCM WAV: duration comes from the header
+            duration = get_wav_duration(output_path) or 0.0
+
+            result: TTSResult = {
+                'audio_path': output_path,
+                'duration': duration,
+                'voice': self.voice,
+                'language': language or self.language,
+                'text_length': len(text)
+            }
+
+            self.logger.debug(f"Synthesis complete: {duration:.2f}s audio")
+
+            return result
+
+        except Exception as e:
+            raise ComponentException(
+                f"Piper TTS synthesis failed: {e}",
+                {'text_length': len(text), 'model': self.model_path}
+            )
+
+    def _synthesize_wav(self, text: str, wav_file: wave.Wave_write) -> None:
+        """
+        Write synthesized speech into an open WAV file
+
+        Supports both the piper-tts 1.3+ API (synthesize_wav with
+        SynthesisConfig) and the older synthesize(text, wav_file, ...).
+
+        Args:
+            text: Text to synthesize
+            wav_file: WAV file opened for writing
+        """
+        # Piper controls speed with phoneme length (inverse of rate)
+        length_scale = 1.0 / self.rate
+
+        if hasattr(self.piper_voice, 'synthesize_wav'):
+            from piper import SynthesisConfig
+
+            syn_config = SynthesisConfig(
+                speaker_id=self.speaker_id,
+                length_scale=length_scale,
+                volume=self.volume / 100
+            )
+            self.piper_voice.synthesize_wav(text, wav_file, syn_config=syn_config)
+        else:
+            self.piper_voice.synthesize(
+                text,
+                wav_file,
+                speaker_id=self.speaker_id,
+                length_scale=length_scale
+            )
+
+    def get_available_voices(self, language: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get available voices (the loaded voice model)
+
+        Args:
+            language: Filter by language (optional)
+
+        Returns:
+            List of voice info dictionaries
+        """
+        if language and not self.language.lower().startswith(language.lower()):
+            return []
+
+        return [{
+            'name': self.voice,
+            'language': self.language,
+            'gender': '',
+            'locale_name': self.voice
+        }]
+
+    def get_info(self) -> Dict[str, Any]:
+        """
+        Get Piper TTS information
+
+        Returns:
+            Dict: Complete TTS info
+        """
+        info = super().get_info()
+        info.update({
+            'engine': 'Piper TTS',
+            'model': self.model_path,
+            'free': True,
+            'cloud_based': False
+        })
+        return info
@@ -5,7 +5,7 @@ Base Video Processor
 Abstract base class for video processing components.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from abc import abstractmethod
 from pathlib import Path
 
@@ -54,7 +54,8 @@ class BaseVideoProcessor(BaseProcessor):
         self,
         video_path: str,
         audio_path: str,
-        audio_format: str = 'wav'
+        audio_format: str = 'wav',
+        detect_speech_start: bool = False
     ) -> Dict[str, Any]:
         """
         Extract audio from video
@@ -63,6 +64,8 @@ class BaseVideoProcessor(BaseProcessor):
             video_path: Path to input video
             audio_path: Path to save extracted audio
             audio_format: Audio format (default: 'wav')
+            detect_speech_start: Also detect when speech starts (leading
+                silence) and report it as 'speech_start' in seconds
 
         Returns:
             Dict with extraction info (duration, sample_rate, etc.)
@@ -75,7 +78,9 @@ class BaseVideoProcessor(BaseProcessor):
         video_path: str,
         audio_path: str,
         output_path: str,
-        remove_original_audio: bool = True
+        remove_original_audio: bool = True,
+        subtitles: Optional[List[Dict[str, str]]] = None,
+        video_info: Optional[VideoInfo] = None
     ) -> Dict[str, Any]:
         """
         Merge audio with video
@@ -85,6 +90,9 @@ class BaseVideoProcessor(BaseProcessor):
             audio_path: Path to audio file
             output_path: Path to save output video
             remove_original_audio: Remove original audio (default: True)
+            subtitles: Subtitle tracks to embed in the same pass, each a
+                dict with 'path', 'language' (ISO 639-2) and 'title'
+            video_info: Known video info, so it is not probed again
 
         Returns:
             Dict with merge info
@@ -227,14 +235,17 @@ class BaseVideoProcessor(BaseProcessor):
             return self.extract_audio(
                 input_data['video_path'],
                 input_data['audio_path'],
-                input_data.get('audio_format', 'wav')
+                input_data.get('audio_format', 'wav'),
+                input_data.get('detect_speech_start', False)
             )
         elif operation == 'merge_audio':
             return self.merge_audio(
                 input_data['video_path'],
                 input_data['audio_path'],
                 input_data['output_path'],
-                input_data.get('remove_original_audio', True)
+                input_data.get('remove_original_audio', True),
+                input_data.get('subtitles'),
+                input_data.get('video_info')
             )
         elif operation == 'get_info':
             return self.get_video_info(input_data['video_path'])
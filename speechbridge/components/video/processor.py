@@ -5,15 +5,16 @@ FFmpeg Video Processor
 Video processing using FFmpeg.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 import subprocess
-import json
 import shutil
 
 from .base import BaseVideoProcessor
 from speechbridge.core.types import VideoInfo
 from speechbridge.core.exceptions import ComponentException
+from speechbridge.utils.serialization import loads as json_loads
+from speechbridge.utils.audio import SILENCEDETECT_FILTER, parse_speech_start
 
 
 class FFmpegProcessor(BaseVideoProcessor):
@@ -111,7 +112,8 @@ class FFmpegProcessor(BaseVideoProcessor):
         self,
         video_path: str,
         audio_path: str,
-        audio_format: str = 'wav'
+        audio_format: str = 'wav',
+        detect_speech_start: bool = False
     ) -> Dict[str, Any]:
         """
         Extract audio from video using FFmpeg
@@ -120,6 +122,8 @@ class FFmpegProcessor(BaseVideoProcessor):
             video_path: Path to input video
             audio_path: Path to save extracted audio
             audio_format: Audio format (default: 'wav')
+            detect_speech_start: Also run silencedetect in the same decode
+                pass and report 'speech_start' (default: False)
 
         Returns:
             Dict with extraction info
@@ -136,11 +140,22 @@ class FFmpegProcessor(BaseVideoProcessor):
         try:
             self.logger.info(f"Extracting audio from: {video_path}")
 
+            # Only errors on stderr, unless silencedetect (info level) is needed
+            log_args = ['-loglevel', 'error']
+            filter_args = []
+            if detect_speech_start:
+                log_args = ['-loglevel', 'info', '-hide_banner', '-nostats']
+                filter_args = ['-af', SILENCEDETECT_FILTER]
+
             # Build FFmpeg command
             cmd = [
                 self.ffmpeg_path,
+                '-nostdin',  # Never wait on stdin
+                *log_args,
                 '-i', video_path,
                 '-vn',  # No video
+                '-sn', '-dn',  # No subtitle/data streams
+                *filter_args,
                 '-acodec', 'pcm_s16le' if audio_format == 'wav' else self.audio_codec,
                 '-ar', '16000',  # Sample rate
                 '-ac', '1',  # Mono
@@ -166,13 +181,18 @@ class FFmpegProcessor(BaseVideoProcessor):
 
             self.logger.info(f"Audio extracted: {duration:.2f}s")
 
-            return {
+            info = {
                 'audio_path': audio_path,
                 'duration': duration,
                 'format': audio_format,
                 'sample_rate': 16000
             }
 
+            if detect_speech_start:
+                info['speech_start'] = parse_speech_start(result.stderr) or 0.0
+
+            return info
+
         except Exception as e:
             raise ComponentException(
                 f"Audio extraction failed: {e}",
@@ -184,7 +204,9 @@ class FFmpegProcessor(BaseVideoProcessor):
         video_path: str,
         audio_path: str,
         output_path: str,
-        remove_original_audio: bool = True
+        remove_original_audio: bool = True,
+        subtitles: Optional[List[Dict[str, str]]] = None,
+        video_info: Optional[VideoInfo] = None
     ) -> Dict[str, Any]:
         """
         Merge audio with video using FFmpeg
@@ -194,6 +216,10 @@ class FFmpegProcessor(BaseVideoProcessor):
             audio_path: Path to audio file
             output_path: Path to save output video
             remove_original_audio: Remove original audio (default: True)
+            subtitles: Subtitle tracks to mux in the same pass, each a dict
+                with 'path', 'language' (ISO 639-2) and 'title'
+            video_info: Result of get_video_info() for video_path, if already
+                known (its duration is used instead of probing again)
 
         Returns:
             Dict with merge info
@@ -212,7 +238,13 @@ class FFmpegProcessor(BaseVideoProcessor):
 
             # Get audio and video durations
             audio_duration = self._get_media_duration(audio_path)
-            video_duration = self._get_media_duration(video_path)
+            if video_info:
+                video_duration = video_info['duration']
+            else:
+                video_duration = self._get_media_duration(video_path)
+
+            # Subtitle tracks are muxed in the same pass (inputs 2, 3, ...)
+            subtitle_inputs, subtitle_args = self._subtitle_mux_args(subtitles or [])
 
             # Build FFmpeg command
             if remove_original_audio:
@@ -229,12 +261,14 @@ class FFmpegProcessor(BaseVideoProcessor):
                         self.ffmpeg_path,
                         '-i', video_path,
                         '-i', audio_path,
+                        *subtitle_inputs,
                         '-filter_complex', f'[0:v]tpad=stop_mode=clone:stop_duration={pad_duration}[v]',
                         '-map', '[v]',
                         '-map', '1:a:0',
                         '-c:v', self.video_codec,
                         '-c:a', self.audio_codec,
                         '-b:a', self.audio_bitrate,
+                        *subtitle_args,
                         '-y',
                         output_path
                     ]
@@ -258,11 +292,13 @@ class FFmpegProcessor(BaseVideoProcessor):
                         self.ffmpeg_path,
                         '-i', video_path,
                         '-i', audio_path,
+                        *subtitle_inputs,
                         '-map', '0:v:0',
                         '-map', '1:a:0',
                         '-c:v', 'copy',
                         '-c:a', self.audio_codec,
                         '-b:a', self.audio_bitrate,
+                        *subtitle_args,
                         '-y',
                         output_path
                     ]
@@ -272,10 +308,14 @@ class FFmpegProcessor(BaseVideoProcessor):
                     self.ffmpeg_path,
                     '-i', video_path,
                     '-i', audio_path,
-                    '-filter_complex', '[0:a][1:a]amix=inputs=2:duration=shortest',
+                    *subtitle_inputs,
+                    '-filter_complex', '[0:a][1:a]amix=inputs=2:duration=shortest[a]',
+                    '-map', '0:v:0',
+                    '-map', '[a]',
                     '-c:v', 'copy',
                     '-c:a', self.audio_codec,
                     '-b:a', self.audio_bitrate,
+                    *subtitle_args,
                     '-y',
                     output_path
                 ]
@@ -311,6 +351,36 @@ class FFmpegProcessor(BaseVideoProcessor):
                 {'video': video_path, 'audio': audio_path, 'output': output_path}
             )
 
+    def _subtitle_mux_args(
+        self,
+        subtitles: List[Dict[str, str]]
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Build FFmpeg arguments that add subtitle tracks to a merge
+
+        Args:
+            subtitles: Subtitle tracks with 'path', 'language' and 'title'
+
+        Returns:
+            Tuple of (input arguments, map/codec/metadata arguments)
+        """
+        inputs = []
+        args = []
+
+        for i, track in enumerate(subtitles):
+            inputs.extend(['-i', track['path']])
+            args.extend([
+                '-map', f'{i + 2}:s',
+                f'-metadata:s:s:{i}', f"language={track['language']}",
+                f'-metadata:s:s:{i}', f"title={track['title']}"
+            ])
+
+        if subtitles:
+            # mov_text is the subtitle codec MP4/QuickTime players support
+            args.extend(['-c:s', 'mov_text'])
+
+        return inputs, args
+
     def get_video_info(self, video_path: str) -> VideoInfo:
         """
         Get video file information using FFprobe
@@ -340,21 +410,20 @@ class FFmpegProcessor(BaseVideoProcessor):
                 video_path
             ]
 
-            # Run FFprobe
+            # Run FFprobe (raw bytes: the JSON decoder handles UTF-8 itself)
             result = subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True
+                capture_output=True
             )
 
             if result.returncode != 0:
                 raise ComponentException(
-                    f"FFprobe failed: {result.stderr}",
+                    f"FFprobe failed: {result.stderr.decode('utf-8', 'replace')}",
                     {'command': ' '.join(cmd)}
                 )
 
             # Parse JSON output
-            data = json.loads(result.stdout)
+            data = json_loads(result.stdout)
 
             # Extract video stream info
             video_stream = next(
@@ -484,8 +553,8 @@ class FFmpegProcessor(BaseVideoProcessor):
                 media_path
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            data = json.loads(result.stdout)
+            result = subprocess.run(cmd, capture_output=True)
+            data = json_loads(result.stdout)
             return float(data['format'].get('duration', 0))
 
         except Exception as e:
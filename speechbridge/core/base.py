@@ -48,6 +48,11 @@ class BaseComponent(ABC):
         """Configuration validation"""
         pass
 
+    def warmup(self) -> None:
+        """Prepare component for first use (default: initialize)"""
+        if not self._initialized:
+            self.initialize()
+
     def is_initialized(self) -> bool:
         """Initialization verification"""
         return self._initialized
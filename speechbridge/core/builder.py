@@ -11,10 +11,12 @@ from pathlib import Path
 from .pipeline import VideoTranslationPipeline
 from ..components.speech.base import BaseSpeechRecognizer
 from ..components.speech.whisper import WhisperRecognizer
+from ..components.speech.faster_whisper import FasterWhisperRecognizer
 from ..components.translation.base import BaseTranslator
 from ..components.translation.deepl import DeepLTranslator
 from ..components.tts.base import BaseTTS
 from ..components.tts.edge_tts import EdgeTTS
+from ..components.tts.piper_tts import PiperTTS
 from ..components.video.base import BaseVideoProcessor
 from ..components.video.processor import FFmpegProcessor
 
@@ -85,6 +87,31 @@ class PipelineBuilder:
         self._speech_recognizer = WhisperRecognizer(config)
         return self
 
+    def with_faster_whisper(
+        self,
+        model: str = 'base',
+        language: str = 'auto',
+        **kwargs
+    ) -> 'PipelineBuilder':
+        """
+        Use Faster-Whisper (CTranslate2) speech recognizer
+
+        Args:
+            model: Whisper model size (default: 'base')
+            language: Source language (default: 'auto')
+            **kwargs: Additional config (compute_type, beam_size, vad_filter, ...)
+
+        Returns:
+            PipelineBuilder: Self for chaining
+        """
+        config = {
+            'model': model,
+            'language': language,
+            **kwargs
+        }
+        self._speech_recognizer = FasterWhisperRecognizer(config)
+        return self
+
     # Translation Builders
 
     def with_translator(
@@ -176,6 +203,36 @@ class PipelineBuilder:
         self._tts_engine = EdgeTTS(config)
         return self
 
+    def with_piper_tts(
+        self,
+        model: Optional[str] = None,
+        language: str = 'en',
+        rate: float = 1.0,
+        **kwargs
+    ) -> 'PipelineBuilder':
+        """
+        Use local Piper TTS engine
+
+        Args:
+            model: Path to Piper voice .onnx file (or use PIPER_MODEL env var)
+            language: Language code of the voice (default: 'en')
+            rate: Speech rate (default: 1.0)
+            **kwargs: Additional Piper config (speaker_id, volume, ...)
+
+        Returns:
+            PipelineBuilder: Self for chaining
+        """
+        config = {
+            'language': language,
+            'rate': rate,
+            **kwargs
+        }
+        if model:
+            config['model'] = model
+
+        self._tts_engine = PiperTTS(config)
+        return self
+
     # Video Processor Builders
 
     def with_video_processor(
@@ -258,6 +315,44 @@ class PipelineBuilder:
         self._pipeline_config['temp_dir'] = temp_dir
         return self
 
+    def with_translation_cache(
+        self,
+        path: str = 'cache/translations.sqlite3',
+        ttl: Optional[float] = None
+    ) -> 'PipelineBuilder':
+        """
+        Cache translations by segment text
+
+        Args:
+            path: SQLite cache file (default: 'cache/translations.sqlite3')
+            ttl: Entry lifetime in seconds (default: None, never expires)
+
+        Returns:
+            PipelineBuilder: Self for chaining
+        """
+        self._pipeline_config['translation_cache'] = path
+        self._pipeline_config['cache_ttl'] = ttl
+        return self
+
+    def with_tts_cache(
+        self,
+        path: str = 'cache/tts.sqlite3',
+        ttl: Optional[float] = None
+    ) -> 'PipelineBuilder':
+        """
+        Cache synthesized speech by text and voice
+
+        Args:
+            path: SQLite cache file (default: 'cache/tts.sqlite3')
+            ttl: Entry lifetime in seconds (default: None, never expires)
+
+        Returns:
+            PipelineBuilder: Self for chaining
+        """
+        self._pipeline_config['tts_cache'] = path
+        self._pipeline_config['tts_cache_ttl'] = ttl
+        return self
+
     def with_progress_callback(
         self,
         callback: Callable[[int, str], None]
@@ -301,13 +396,13 @@ class PipelineBuilder:
         """
         # Validate components
         if not self._speech_recognizer:
-            raise ValueError("Speech recognizer not configured. Use with_whisper() or with_speech_recognizer()")
+            raise ValueError("Speech recognizer not configured. Use with_whisper(), with_faster_whisper() or with_speech_recognizer()")
 
         if not self._translator:
             raise ValueError("Translator not configured. Use with_deepl() or with_translator()")
 
         if not self._tts_engine:
-            raise ValueError("TTS engine not configured. Use with_edge_tts() or with_tts()")
+            raise ValueError("TTS engine not configured. Use with_edge_tts(), with_piper_tts() or with_tts()")
 
         if not self._video_processor:
             raise ValueError("Video processor not configured. Use with_ffmpeg() or with_video_processor()")
@@ -401,6 +496,7 @@ def create_pipeline(
     speech_model: str = 'base',
     target_language: str = 'en',
     deepl_api_key: Optional[str] = None,
+    speech_engine: str = 'whisper',
     **kwargs
 ) -> VideoTranslationPipeline:
     """
@@ -410,6 +506,7 @@ def create_pipeline(
         speech_model: Whisper model size (default: 'base')
         target_language: Target language for translation (default: 'en')
         deepl_api_key: DeepL API key (optional, uses env var if not provided)
+        speech_engine: 'whisper' or 'faster-whisper' (default: 'whisper')
         **kwargs: Additional pipeline config
 
     Returns:
@@ -422,8 +519,13 @@ def create_pipeline(
         ...     deepl_api_key='your-key'
         ... )
     """
-    builder = (PipelineBuilder()
-               .with_whisper(model=speech_model)
+    builder = PipelineBuilder()
+    if speech_engine == 'faster-whisper':
+        builder.with_faster_whisper(model=speech_model)
+    else:
+        builder.with_whisper(model=speech_model)
+
+    builder = (builder
                .with_deepl(api_key=deepl_api_key, target_lang=target_language)
                .with_edge_tts()
                .with_ffmpeg())
@@ -109,7 +109,7 @@ class GPUManager:
 
     def get_gpu_info(self) -> GPUInfo:
         """
-        Getting information about the GPU
+        Getting information about the GPU (detected once, then cached)
 
         Returns:
             GPUInfo: Information about GPU
@@ -118,6 +118,19 @@ class GPUManager:
             self._gpu_info = self._detect_gpu()
         return self._gpu_info
 
+    def refresh_gpu_info(self) -> GPUInfo:
+        """
+        Re-detect GPU devices
+
+        get_gpu_info() returns the result detected once per process;
+        call this after devices change (e.g. driver reload).
+
+        Returns:
+            GPUInfo: Fresh information about GPU
+        """
+        self._gpu_info = self._detect_gpu()
+        return self._gpu_info
+
     def get_optimal_device(self) -> DeviceType:
         """
         Getting the best device
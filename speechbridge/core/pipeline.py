@@ -8,15 +8,53 @@ Complete video translation pipeline orchestrator.
 from typing import Dict, Any, Optional, List, Callable
 from pathlib import Path
 from datetime import datetime
+from itertools import chain, repeat
+from concurrent.futures import Future, ThreadPoolExecutor
+import inspect
 import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
 
 from .types import ProcessingResult, TranscriptionResult, TranslationResult, TTSResult, VideoInfo
-from .exceptions import ComponentException
+from .exceptions import ComponentException, ValidationException
 from .gpu import GPUManager
 from ..components.speech.base import BaseSpeechRecognizer
 from ..components.translation.base import BaseTranslator
 from ..components.tts.base import BaseTTS
 from ..components.video.base import BaseVideoProcessor
+from ..components.audio.sync import AudioSynchronizer
+from ..components.subtitles.generator import SubtitleGenerator
+from ..components.translation.cache import TranslationCache, CachedTranslator
+from ..components.tts.cache import TTSCache, CachedTTS
+from ..utils.audio import get_wav_duration
+from ..utils.serialization import dumps as json_dumps
+
+
+def _accepts_kwarg(func: Callable, name: str) -> bool:
+    """
+    Check whether a callable takes a keyword argument
+
+    Custom components may implement an older method signature without
+    the optional keyword arguments added later.
+
+    Args:
+        func: Function or bound method
+        name: Keyword argument name
+
+    Returns:
+        bool: True if func accepts name (directly or via **kwargs)
+    """
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+    return name in params or any(
+        param.kind is inspect.Parameter.VAR_KEYWORD for param in params.values()
+    )
 
 
 class VideoTranslationPipeline:
@@ -57,6 +95,19 @@ class VideoTranslationPipeline:
                 - subtitle_only: Only generate subtitles, no audio translation (default: False)
                 - export_text: Export text translation with timing (default: False)
                 - embed_subtitles: Embed subtitles into video file (default: False)
+                - tts_workers: Parallel TTS syntheses in sync mode (default: 8)
+                - batch_workers: Videos processed concurrently by
+                  process_video_batch (default: 1, sequential)
+                - warmup: Run a dummy inference when validate_components
+                  initializes models (default: True)
+                - translation_cache: SQLite file caching translations by
+                  segment text (default: None, no cache)
+                - cache_ttl: Translation cache entry lifetime in seconds
+                  (default: None, never expires)
+                - tts_cache: SQLite file caching synthesized speech by text
+                  and voice (default: None, no cache)
+                - tts_cache_ttl: TTS cache entry lifetime in seconds
+                  (default: None, never expires)
         """
         self.speech_recognizer = speech_recognizer
         self.translator = translator
@@ -64,6 +115,27 @@ class VideoTranslationPipeline:
         self.video_processor = video_processor
 
         self.config = config or {}
+
+        # Serve repeated segment texts from the translation cache
+        if self.config.get('translation_cache'):
+            self.translator = CachedTranslator(
+                translator,
+                TranslationCache(
+                    self.config['translation_cache'],
+                    ttl=self.config.get('cache_ttl')
+                )
+            )
+
+        # Serve repeated segment texts from the TTS cache
+        if self.config.get('tts_cache'):
+            self.tts_engine = CachedTTS(
+                tts_engine,
+                TTSCache(
+                    self.config['tts_cache'],
+                    ttl=self.config.get('tts_cache_ttl')
+                )
+            )
+
         self.temp_dir = Path(self.config.get('temp_dir', 'temp'))
         self.keep_temp = self.config.get('keep_temp', False)
         self.progress_callback = self.config.get('progress_callback')
@@ -73,6 +145,17 @@ class VideoTranslationPipeline:
         self.subtitle_only = self.config.get('subtitle_only', False)
         self.export_text = self.config.get('export_text', False)
         self.embed_subtitles = self.config.get('embed_subtitles', False)
+        self.batch_workers = self.config.get('batch_workers', 1)
+        self.warmup = self.config.get('warmup', True)
+
+        # Speech recognition holds the (GPU) model: one transcription at a time
+        self._transcribe_lock = threading.Lock()
+
+        # Subtitle/text export writes overlap speech synthesis
+        self._text_executor = ThreadPoolExecutor(
+            max_workers=2,
+            thread_name_prefix='speechbridge-text'
+        )
 
         self.gpu_manager = GPUManager()
         self.logger = logging.getLogger('speechbridge.pipeline')
@@ -83,8 +166,9 @@ class VideoTranslationPipeline:
         # Initialize audio synchronizer if needed
         self.audio_sync = None
         if self.sync_audio:
-            from ..components.audio.sync import AudioSynchronizer
-            self.audio_sync = AudioSynchronizer()
+            self.audio_sync = AudioSynchronizer(
+                max_workers=self.config.get('tts_workers', 8)
+            )
 
     def process_video(
         self,
@@ -107,10 +191,19 @@ class VideoTranslationPipeline:
         """
         self.logger.info("=" * 80)
         self.logger.info("Starting video translation pipeline")
-        self.logger.info(f"Input: {video_path}")
-        self.logger.info(f"Output: {output_path}")
+        self.logger.info("Input: %s", video_path)
+        self.logger.info("Output: %s", output_path)
         self.logger.info("=" * 80)
 
+        # Output naming shared by subtitle and text export steps
+        output_file = Path(output_path)
+        output_base = output_file.stem
+        output_dir = output_file.parent
+
+        # Per-run temp directory, so concurrent runs never share or clean up
+        # each other's files; names inside it are fixed
+        temp_dir = Path(tempfile.mkdtemp(prefix='job_', dir=self.temp_dir))
+
         result: ProcessingResult = {
             'success': False,
             'output_path': None,
@@ -122,43 +215,64 @@ class VideoTranslationPipeline:
             }
         }
 
+        # Subtitle/text export writer (Future), started after translation
+        text_outputs = None
+
         try:
             # Step 1: Get video info
             self._update_progress(0, "Getting video information")
             video_info = self.video_processor.get_video_info(video_path)
             result['metadata']['video_info'] = video_info
             self.logger.info(
-                f"Video info: {video_info['width']}x{video_info['height']} "
-                f"@ {video_info['fps']:.2f}fps, {video_info['duration']:.2f}s"
+                "Video info: %sx%s @ %.2ffps, %.2fs",
+                video_info['width'], video_info['height'], video_info['fps'], video_info['duration']
             )
 
             # Step 2: Extract audio
             self._update_progress(10, "Extracting audio from video")
-            audio_path = self.temp_dir / f"audio_{datetime.now().timestamp()}.wav"
+            audio_path = temp_dir / "audio.wav"
+            # In sync mode, leading silence is detected in the same decode pass
+            # (processors with the older signature fall back to a file scan)
+            extract_kwargs = {}
+            if (self.sync_audio and self.audio_sync
+                    and _accepts_kwarg(self.video_processor.extract_audio, 'detect_speech_start')):
+                extract_kwargs['detect_speech_start'] = True
             extract_info = self.video_processor.extract_audio(
                 video_path,
-                str(audio_path)
+                str(audio_path),
+                **extract_kwargs
             )
-            self.logger.info(f"Audio extracted: {extract_info['duration']:.2f}s")
+            self.logger.info("Audio extracted: %.2fs", extract_info['duration'])
 
             # Step 3: Transcribe audio
             self._update_progress(30, "Transcribing audio to text")
-            transcription = self.speech_recognizer.transcribe(str(audio_path))
+            with self._transcribe_lock:
+                transcription = self.speech_recognizer.transcribe(str(audio_path))
             result['transcription'] = transcription
+
+            # Validate segments once; later steps index them directly
+            segments = transcription.get('segments')
+            if segments is None:
+                segments = transcription['segments'] = []
+            elif not isinstance(segments, list):
+                raise ValidationException(
+                    "Transcription segments must be a list",
+                    {'type': type(segments).__name__}
+                )
+
             self.logger.info(
-                f"Transcription complete: {len(transcription['text'])} chars, "
-                f"language: {transcription['language']}, "
-                f"segments: {len(transcription.get('segments', []))}"
+                "Transcription complete: %s chars, language: %s, segments: %s",
+                len(transcription['text']), transcription['language'], len(segments)
             )
 
             # Step 4: Translate text (with or without synchronization)
             self._update_progress(50, "Translating text")
 
-            if self.sync_audio and transcription.get('segments'):
+            if self.sync_audio and segments:
                 # Translate segments individually for synchronization
                 self.logger.info("Using synchronized translation mode")
                 translated_texts = self.audio_sync.translate_segments(
-                    transcription['segments'],
+                    segments,
                     self.translator,
                     source_lang or transcription['language'],
                     target_lang or self.translator.target_lang
@@ -182,164 +296,48 @@ class VideoTranslationPipeline:
 
             result['translation'] = translation
             self.logger.info(
-                f"Translation complete: {len(translation['text'])} chars, "
-                f"{translation['source_lang']} -> {translation['target_lang']}"
+                "Translation complete: %s chars, %s -> %s",
+                len(translation['text']), translation['source_lang'], translation['target_lang']
             )
 
             # Step 4.4: Correct segment timing for initial silence (if sync mode enabled)
             # This ensures subtitles and TTS use corrected timing
-            if self.sync_audio and transcription.get('segments') and self.audio_sync:
-                actual_speech_start = 0.0
-                if audio_path.exists():
-                    # Detect actual speech start time
-                    import subprocess
-                    try:
-                        cmd = [
-                            'ffmpeg',
-                            '-i', str(audio_path),
-                            '-af', 'silencedetect=noise=-30dB:d=0.5',
-                            '-f', 'null',
-                            '-'
-                        ]
-                        result_proc = subprocess.run(
-                            cmd,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            text=True,
-                            timeout=60
-                        )
-
-                        # Parse output for first silence_end
-                        for line in result_proc.stderr.split('\n'):
-                            if 'silence_end:' in line:
-                                parts = line.split('silence_end:')[1].split('|')[0].strip()
-                                actual_speech_start = float(parts)
-                                break
-                    except Exception as e:
-                        self.logger.warning(f"Failed to detect speech start: {e}")
+            if self.sync_audio and segments and self.audio_sync:
+                # Detected during extraction; otherwise scan the file. The
+                # scan reads only the leading silence, so it runs whenever
+                # the correction could apply (any first segment start)
+                actual_speech_start = extract_info.get('speech_start')
+                if actual_speech_start is None and audio_path.exists():
+                    actual_speech_start = self.audio_sync._detect_speech_start(str(audio_path))
 
                 # Correct first segment timing if needed
-                if actual_speech_start > 0 and transcription['segments']:
-                    if transcription['segments'][0]['start'] < actual_speech_start - 0.5:
-                        self.logger.info(
-                            f"Correcting initial silence: {actual_speech_start:.2f}s "
-                            f"(Whisper reported: {transcription['segments'][0]['start']:.2f}s)"
-                        )
-                        # Adjust first segment start time
-                        old_start = transcription['segments'][0]['start']
-                        transcription['segments'][0]['start'] = actual_speech_start
-
-                        # Log the correction
-                        self.logger.debug(
-                            f"First segment corrected: {old_start:.2f}s -> {actual_speech_start:.2f}s"
-                        )
-
-            # Step 4.5: Generate subtitles if requested
-            subtitle_files = []
-            if self.generate_subtitles or self.subtitle_only:
-                self._update_progress(60, "Generating subtitles")
-
-                if not transcription.get('segments'):
-                    self.logger.warning("No segments available for subtitle generation")
-                else:
-                    from ..components.subtitles.generator import SubtitleGenerator
-                    subtitle_gen = SubtitleGenerator()
-
-                    # Get base name for subtitle files
-                    output_base = Path(output_path).stem
-                    output_dir = Path(output_path).parent
-
-                    # Get original and translated texts
-                    original_texts = [seg['text'] for seg in transcription['segments']]
-                    if translation.get('segments'):
-                        translated_texts = translation['segments']
-                    else:
-                        # If no segmented translation, use full text (less ideal)
-                        translated_texts = [translation['text']]
-
-                    # Generate subtitle formats
-                    if self.subtitle_format in ['srt', 'both']:
-                        srt_original = output_dir / f"{output_base}_original_{transcription['language']}.srt"
-                        srt_translated = output_dir / f"{output_base}_translated_{translation['target_lang']}.srt"
-
-                        subtitle_gen.generate_srt(
-                            transcription['segments'],
-                            original_texts,
-                            str(srt_original)
-                        )
-                        subtitle_gen.generate_srt(
-                            transcription['segments'],
-                            translated_texts,
-                            str(srt_translated)
-                        )
-
-                        subtitle_files.extend([str(srt_original), str(srt_translated)])
-                        self.logger.info(f"Generated SRT subtitles: {srt_original.name}, {srt_translated.name}")
-
-                    if self.subtitle_format in ['vtt', 'both']:
-                        vtt_original = output_dir / f"{output_base}_original_{transcription['language']}.vtt"
-                        vtt_translated = output_dir / f"{output_base}_translated_{translation['target_lang']}.vtt"
-
-                        subtitle_gen.generate_vtt(
-                            transcription['segments'],
-                            original_texts,
-                            str(vtt_original)
-                        )
-                        subtitle_gen.generate_vtt(
-                            transcription['segments'],
-                            translated_texts,
-                            str(vtt_translated)
-                        )
-
-                        subtitle_files.extend([str(vtt_original), str(vtt_translated)])
-                        self.logger.info(f"Generated VTT subtitles: {vtt_original.name}, {vtt_translated.name}")
-
-                    result['subtitle_files'] = subtitle_files
-
-            # Step 4.6: Export text with timing if requested
-            if self.export_text:
-                self._update_progress(65, "Exporting text with timing")
-
-                output_base = Path(output_path).stem
-                output_dir = Path(output_path).parent
-                text_export_path = output_dir / f"{output_base}_translation_timing.json"
-
-                import json
-                export_data = {
-                    'video': str(video_path),
-                    'source_language': translation['source_lang'],
-                    'target_language': translation['target_lang'],
-                    'duration': video_info['duration'],
-                    'segments': []
-                }
-
-                if transcription.get('segments'):
-                    original_texts = [seg['text'] for seg in transcription['segments']]
-                    translated_texts = translation.get('segments', [translation['text']])
-
-                    for i, seg in enumerate(transcription['segments']):
-                        export_data['segments'].append({
-                            'index': i + 1,
-                            'start': seg['start'],
-                            'end': seg['end'],
-                            'duration': seg['end'] - seg['start'],
-                            'original_text': original_texts[i] if i < len(original_texts) else '',
-                            'translated_text': translated_texts[i] if i < len(translated_texts) else ''
-                        })
-
-                with open(text_export_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, ensure_ascii=False, indent=2)
-
-                result['text_export'] = str(text_export_path)
-                self.logger.info(f"Text export saved: {text_export_path.name}")
+                self.audio_sync.correct_speech_start(segments, actual_speech_start)
+
+            # Step 4.5/4.6: Subtitles and text export are plain file writes;
+            # they run on a worker thread while speech is synthesized
+            write_subtitles = self.generate_subtitles or self.subtitle_only
+            if write_subtitles or self.export_text:
+                self._update_progress(60, "Generating subtitles and text export")
+                text_outputs = self._text_executor.submit(
+                    self._write_text_outputs,
+                    video_path,
+                    video_info,
+                    segments,
+                    transcription,
+                    translation,
+                    output_dir,
+                    output_base,
+                    write_subtitles
+                )
 
             # Step 5: Synthesize speech (skip if subtitle-only mode)
             if self.subtitle_only:
                 self.logger.info("Subtitle-only mode: Skipping audio synthesis and merging")
 
-                # Copy original video to output path
-                import shutil
-                shutil.copy2(video_path, output_path)
+                subtitle_files = self._collect_text_outputs(text_outputs, result)
+
+                # Original video becomes the output (hard link when possible)
+                self._link_or_copy(video_path, output_path)
 
                 # Embed subtitles if requested
                 if self.embed_subtitles and subtitle_files:
@@ -370,39 +368,38 @@ class VideoTranslationPipeline:
                 return result
 
             self._update_progress(70, "Synthesizing translated speech")
-            translated_audio_path = self.temp_dir / f"translated_{datetime.now().timestamp()}.wav"
+            translated_audio_path = temp_dir / "translated.wav"
 
-            if self.sync_audio and transcription.get('segments') and translation.get('segments'):
+            if self.sync_audio and segments and translation.get('segments'):
                 # Synchronized TTS with original timing
                 self.logger.info("Using synchronized TTS mode")
-                sync_dir = self.temp_dir / f"sync_{datetime.now().timestamp()}"
+                sync_dir = temp_dir / "sync"
                 sync_dir.mkdir(exist_ok=True)
 
                 synced_audio, corrected_segments = self.audio_sync.synchronize_segments(
-                    transcription['segments'],
+                    segments,
                     translation['segments'],
                     str(sync_dir),
                     self.tts_engine,
                     translation['target_lang'],
-                    video_info['duration'],
-                    original_audio_path=str(audio_path)  # Pass original audio for silence detection
+                    video_info['duration']
                 )
 
                 # Update transcription segments with corrected timing for subtitle generation
-                transcription['segments'] = corrected_segments
-
-                # Copy synchronized audio to expected path
-                import shutil
-                shutil.copy2(synced_audio, str(translated_audio_path))
-
-                # Get duration from synchronized audio
-                import subprocess
-                probe_result = subprocess.run(
-                    ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-                     '-of', 'default=noprint_wrappers=1:nokey=1', str(translated_audio_path)],
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-                tts_duration = float(probe_result.stdout.strip()) if probe_result.returncode == 0 else 0.0
+                transcription['segments'] = segments = corrected_segments
+
+                # Move synchronized audio to expected path (same temp tree)
+                os.replace(synced_audio, translated_audio_path)
+
+                # Get duration from the WAV header; ffprobe only for non-PCM output
+                tts_duration = get_wav_duration(translated_audio_path)
+                if tts_duration is None:
+                    probe_result = subprocess.run(
+                        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                         '-of', 'default=noprint_wrappers=1:nokey=1', str(translated_audio_path)],
+                        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                    )
+                    tts_duration = float(probe_result.stdout.strip()) if probe_result.returncode == 0 else 0.0
 
                 tts_result = {
                     'audio_path': str(translated_audio_path),
@@ -420,34 +417,75 @@ class VideoTranslationPipeline:
                 tts_result['synchronized'] = False
 
             result['tts'] = tts_result
-            self.logger.info(f"Speech synthesis complete: {tts_result['duration']:.2f}s")
+            self.logger.info("Speech synthesis complete: %.2fs", tts_result['duration'])
 
-            # Step 6: Merge audio with video
-            self._update_progress(90, "Merging audio with video")
-            merge_info = self.video_processor.merge_audio(
-                video_path,
-                str(translated_audio_path),
-                output_path,
-                remove_original_audio=True
-            )
-            self.logger.info(f"Audio merged: {output_path}")
+            # Subtitle files must be complete before they are embedded
+            subtitle_files = self._collect_text_outputs(text_outputs, result)
 
-            # Step 7: Embed subtitles if requested
+            # Step 6/7: Merge audio with video, embedding subtitles in the same mux
+            subtitle_tracks = []
             if self.embed_subtitles and subtitle_files:
+                subtitle_tracks = self._subtitle_tracks(
+                    subtitle_files,
+                    translation['source_lang'],
+                    translation['target_lang']
+                )
+
+            self._update_progress(90, "Merging audio with video")
+            # Optional merge keywords are passed only to processors that
+            # take them (custom processors may have the older signature)
+            merge_audio = self.video_processor.merge_audio
+            merge_kwargs = {}
+            if _accepts_kwarg(merge_audio, 'video_info'):
+                merge_kwargs['video_info'] = video_info
+            embed_after_merge = False
+
+            merge_info = None
+            if subtitle_tracks and not _accepts_kwarg(merge_audio, 'subtitles'):
+                embed_after_merge = True
+            elif subtitle_tracks:
+                try:
+                    merge_info = merge_audio(
+                        video_path,
+                        str(translated_audio_path),
+                        output_path,
+                        remove_original_audio=True,
+                        subtitles=subtitle_tracks,
+                        **merge_kwargs
+                    )
+                    result['metadata']['subtitles_embedded'] = True
+                    self.logger.info("Subtitles embedded into video")
+                except ComponentException as e:
+                    self.logger.warning("Failed to embed subtitles (%s), merging audio only", e)
+                    result['warnings'].append("Failed to embed subtitles")
+            elif self.embed_subtitles and subtitle_files:
+                result['warnings'].append("Failed to embed subtitles")
+                self.logger.warning("No SRT subtitle files to embed")
+
+            if merge_info is None:
+                merge_info = merge_audio(
+                    video_path,
+                    str(translated_audio_path),
+                    output_path,
+                    remove_original_audio=True,
+                    **merge_kwargs
+                )
+
+            if embed_after_merge:
+                # Processor cannot mux subtitles itself: re-mux the merged file
                 self._update_progress(95, "Embedding subtitles into video")
-                embedded = self._embed_subtitles_into_video(
+                if self._embed_subtitles_into_video(
                     output_path,
                     subtitle_files,
                     output_path,
                     translation['source_lang'],
                     translation['target_lang']
-                )
-                if embedded:
+                ):
                     result['metadata']['subtitles_embedded'] = True
                     self.logger.info("Subtitles embedded into video")
                 else:
                     result['warnings'].append("Failed to embed subtitles")
-                    self.logger.warning("Failed to embed subtitles, but processing continues")
+            self.logger.info("Audio merged: %s", output_path)
 
             # Success
             result['success'] = True
@@ -467,9 +505,16 @@ class VideoTranslationPipeline:
             result['success'] = False
 
         finally:
+            # A failed step can leave the text writer unawaited: cancel it,
+            # or wait for it if already running and report its error
+            if text_outputs is not None and not text_outputs.cancel():
+                text_error = text_outputs.exception()
+                if text_error is not None and not result['success']:
+                    self.logger.warning("Text output writing failed: %s", text_error)
+
             # Cleanup temporary files
             if not self.keep_temp:
-                self._cleanup_temp_files()
+                self._cleanup_temp_files(temp_dir)
 
         return result
 
@@ -495,13 +540,18 @@ class VideoTranslationPipeline:
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True, parents=True)
 
-        results = []
         total = len(video_paths)
 
-        self.logger.info(f"Processing batch of {total} videos")
+        self.logger.info("Processing batch of %s videos", total)
+
+        # Initialize and warm up components once, before videos share them
+        components = (self.speech_recognizer, self.translator, self.tts_engine, self.video_processor)
+        if not all(component.is_initialized() for component in components):
+            self.validate_components()
 
-        for i, video_path in enumerate(video_paths):
-            self.logger.info(f"Processing video {i+1}/{total}: {video_path}")
+        def process_one(i: int) -> ProcessingResult:
+            video_path = video_paths[i]
+            self.logger.info("Processing video %s/%s: %s", i+1, total, video_path)
 
             # Generate output path
             input_name = Path(video_path).stem
@@ -515,15 +565,28 @@ class VideoTranslationPipeline:
                 target_lang
             )
 
-            results.append(result)
-
             # Log result
             if result['success']:
-                self.logger.info(f"✓ Video {i+1}/{total} completed")
+                self.logger.info("✓ Video %s/%s completed", i+1, total)
             else:
-                self.logger.error(f"✗ Video {i+1}/{total} failed: {result['errors']}")
-
-        self.logger.info(f"Batch processing complete: {sum(1 for r in results if r['success'])}/{total} succeeded")
+                self.logger.error("✗ Video %s/%s failed: %s", i+1, total, result['errors'])
+
+            return result
+
+        # Videos overlap ffmpeg, translation and TTS work; transcription
+        # is serialized on the shared model by process_video
+        workers = max(1, min(self.batch_workers, total))
+        if workers == 1:
+            results = [process_one(i) for i in range(total)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map() keeps results in input order
+                results = list(executor.map(process_one, range(total)))
+
+        self.logger.info(
+            "Batch processing complete: %s/%s succeeded",
+            sum(1 for r in results if r['success']), total
+        )
 
         return results
 
@@ -548,21 +611,24 @@ class VideoTranslationPipeline:
 
         for name, component in components:
             try:
-                # Initialize component
+                # Initialize component (and warm up models)
                 if not component._initialized:
-                    self.logger.info(f"Initializing {name}...")
-                    component.initialize()
-                    self.logger.info(f"✓ {name} initialized")
+                    self.logger.info("Initializing %s...", name)
+                    if self.warmup:
+                        component.warmup()
+                    else:
+                        component.initialize()
+                    self.logger.info("✓ %s initialized", name)
 
                 # Validate config
-                self.logger.info(f"Validating {name} configuration...")
+                self.logger.info("Validating %s configuration...", name)
                 if not component.validate_config():
                     error_msg = f"{name} configuration is invalid"
                     self.logger.error(error_msg)
                     errors.append(error_msg)
                     all_valid = False
                 else:
-                    self.logger.info(f"✓ {name} validated")
+                    self.logger.info("✓ %s validated", name)
 
             except Exception as e:
                 error_msg = f"{name} validation failed: {e}"
@@ -574,7 +640,7 @@ class VideoTranslationPipeline:
             self.logger.error("=" * 60)
             self.logger.error("VALIDATION ERRORS:")
             for error in errors:
-                self.logger.error(f"  - {error}")
+                self.logger.error("  - %s", error)
             self.logger.error("=" * 60)
 
         return all_valid
@@ -596,6 +662,144 @@ class VideoTranslationPipeline:
             'keep_temp': self.keep_temp
         }
 
+    def _write_text_outputs(
+        self,
+        video_path: str,
+        video_info: VideoInfo,
+        segments: List[Dict[str, Any]],
+        transcription: TranscriptionResult,
+        translation: TranslationResult,
+        output_dir: Path,
+        output_base: str,
+        write_subtitles: bool
+    ) -> Dict[str, Any]:
+        """
+        Write subtitle files and text export for one video
+
+        Runs on the text output thread while speech is synthesized.
+
+        Args:
+            video_path: Path to input video
+            video_info: Video information
+            segments: Transcription segments with timing
+            transcription: Transcription result
+            translation: Translation result
+            output_dir: Directory for output files
+            output_base: Output file name stem
+            write_subtitles: Generate subtitle files
+
+        Returns:
+            Dict with 'subtitle_files' and/or 'text_export' (what was written)
+        """
+        outputs = {}
+
+        # Translated texts, shared by both steps (original texts are read
+        # straight from the segments)
+        if translation.get('segments'):
+            translated_texts = translation['segments']
+        else:
+            # If no segmented translation, use full text (less ideal)
+            translated_texts = [translation['text']]
+
+        # Step 4.5: Generate subtitles if requested
+        if write_subtitles:
+            if not segments:
+                self.logger.warning("No segments available for subtitle generation")
+            else:
+                subtitle_gen = SubtitleGenerator()
+                formats = [
+                    fmt for fmt in ('srt', 'vtt')
+                    if self.subtitle_format in (fmt, 'both')
+                ]
+
+                def write_format(fmt: str) -> List[str]:
+                    original = output_dir / f"{output_base}_original_{transcription['language']}.{fmt}"
+                    translated = output_dir / f"{output_base}_translated_{translation['target_lang']}.{fmt}"
+
+                    subtitle_gen.generate_dual_subtitles(
+                        segments,
+                        (seg['text'] for seg in segments),
+                        translated_texts,
+                        str(original),
+                        str(translated),
+                        format=fmt
+                    )
+
+                    self.logger.info(
+                        "Generated %s subtitles: %s, %s",
+                        fmt.upper(), original.name, translated.name
+                    )
+                    return [str(original), str(translated)]
+
+                # Formats are independent files: write them concurrently
+                if len(formats) > 1:
+                    with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+                        paths_per_format = list(executor.map(write_format, formats))
+                else:
+                    paths_per_format = [write_format(fmt) for fmt in formats]
+
+                subtitle_files = [path for paths in paths_per_format for path in paths]
+                outputs['subtitle_files'] = subtitle_files
+
+        # Step 4.6: Export text with timing if requested
+        if self.export_text:
+            text_export_path = output_dir / f"{output_base}_translation_timing.json"
+
+            export_data = {
+                'video': str(video_path),
+                'source_language': translation['source_lang'],
+                'target_language': translation['target_lang'],
+                'duration': video_info['duration'],
+                'segments': []
+            }
+
+            if segments:
+                # Pad missing translations with '' instead of bounds-checking each index
+                segment_texts = zip(segments, chain(translated_texts, repeat('')))
+
+                export_data['segments'] = [
+                    {
+                        'index': i,
+                        'start': seg['start'],
+                        'end': seg['end'],
+                        'duration': seg['end'] - seg['start'],
+                        'original_text': seg['text'],
+                        'translated_text': translated_text
+                    }
+                    for i, (seg, translated_text) in enumerate(segment_texts, 1)
+                ]
+
+            text_export_path.write_bytes(json_dumps(export_data, indent=True))
+
+            outputs['text_export'] = str(text_export_path)
+            self.logger.info("Text export saved: %s", text_export_path.name)
+
+        return outputs
+
+    def _collect_text_outputs(
+        self,
+        text_outputs: Optional[Future],
+        result: ProcessingResult
+    ) -> List[str]:
+        """
+        Wait for text outputs and record them in the result
+
+        Args:
+            text_outputs: Future from _write_text_outputs (None if not requested)
+            result: Processing result to update
+
+        Returns:
+            List[str]: Generated subtitle files
+        """
+        if text_outputs is None:
+            return []
+
+        # Re-raises any error from the writer thread
+        outputs = text_outputs.result()
+        result.update(outputs)
+
+        return outputs.get('subtitle_files', [])
+
     def _update_progress(self, percent: int, message: str) -> None:
         """
         Update progress
@@ -604,13 +808,61 @@ class VideoTranslationPipeline:
             percent: Progress percentage (0-100)
             message: Progress message
         """
-        self.logger.info(f"[{percent}%] {message}")
+        self.logger.info("[%s%%] %s", percent, message)
 
         if self.progress_callback:
             try:
                 self.progress_callback(percent, message)
             except Exception as e:
-                self.logger.warning(f"Progress callback failed: {e}")
+                self.logger.warning("Progress callback failed: %s", e)
+
+    def _subtitle_tracks(
+        self,
+        subtitle_files: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> List[Dict[str, str]]:
+        """
+        Describe subtitle files as tracks for embedding
+
+        Args:
+            subtitle_files: List of subtitle file paths
+            source_lang: Source language code (e.g., 'en')
+            target_lang: Target language code (e.g., 'ru')
+
+        Returns:
+            List of dicts with 'path', 'language' (ISO 639-2) and 'title';
+            SRT files only (FFmpeg mov_text works best with SRT)
+        """
+        # Language code mapping (2-letter to 3-letter ISO 639-2)
+        lang_map = {
+            'en': 'eng', 'ru': 'rus', 'es': 'spa', 'fr': 'fra', 'de': 'deu',
+            'zh': 'chi', 'ja': 'jpn', 'ko': 'kor', 'it': 'ita', 'pt': 'por',
+            'ar': 'ara', 'hi': 'hin', 'tr': 'tur', 'nl': 'nld', 'pl': 'pol'
+        }
+
+        tracks = []
+        for sub_file in subtitle_files:
+            if not sub_file.endswith('.srt'):
+                continue
+
+            filename = Path(sub_file).stem
+
+            # Determine language and label
+            if 'original' in filename:
+                lang_code = lang_map.get(source_lang, source_lang)
+                label = f"{source_lang.upper()} (Original)"
+            elif 'translated' in filename:
+                lang_code = lang_map.get(target_lang, target_lang)
+                label = f"{target_lang.upper()} (Translated)"
+            else:
+                lang_code = 'und'  # undefined
+                label = "Subtitles"
+
+            tracks.append({'path': sub_file, 'language': lang_code, 'title': label})
+            self.logger.info("  Track %s: %s [%s]", len(tracks), label, lang_code)
+
+        return tracks
 
     def _embed_subtitles_into_video(
         self,
@@ -633,36 +885,26 @@ class VideoTranslationPipeline:
         Returns:
             bool: True if successful
         """
-        import subprocess
-
-        # Language code mapping (2-letter to 3-letter ISO 639-2)
-        lang_map = {
-            'en': 'eng', 'ru': 'rus', 'es': 'spa', 'fr': 'fra', 'de': 'deu',
-            'zh': 'chi', 'ja': 'jpn', 'ko': 'kor', 'it': 'ita', 'pt': 'por',
-            'ar': 'ara', 'hi': 'hin', 'tr': 'tur', 'nl': 'nld', 'pl': 'pol'
-        }
+        tracks = self._subtitle_tracks(subtitle_files, source_lang, target_lang)
 
-        # Filter SRT files only (FFmpeg mov_text works best with SRT)
-        srt_files = [f for f in subtitle_files if f.endswith('.srt')]
-
-        if not srt_files:
+        if not tracks:
             self.logger.warning("No SRT subtitle files to embed")
             return False
 
-        self.logger.info(f"Embedding {len(srt_files)} subtitle tracks into video")
+        self.logger.info("Embedding %s subtitle tracks into video", len(tracks))
 
         # Build FFmpeg command
         cmd = ['ffmpeg', '-y', '-i', video_path]
 
         # Add subtitle inputs
-        for sub_file in srt_files:
-            cmd.extend(['-i', sub_file])
+        for track in tracks:
+            cmd.extend(['-i', track['path']])
 
         # Map video and audio from original
         cmd.extend(['-map', '0:v', '-map', '0:a'])
 
         # Map each subtitle track
-        for i in range(len(srt_files)):
+        for i in range(len(tracks)):
             cmd.extend(['-map', f'{i+1}:s'])
 
         # Copy video and audio codecs
@@ -677,32 +919,15 @@ class VideoTranslationPipeline:
         # This prevents cutting the video to subtitle length
 
         # Set metadata for each subtitle track
-        subtitle_index = 0
-        for sub_file in srt_files:
-            filename = Path(sub_file).stem
-
-            # Determine language and label
-            if 'original' in filename:
-                lang_code = lang_map.get(source_lang, source_lang)
-                label = f"{source_lang.upper()} (Original)"
-            elif 'translated' in filename:
-                lang_code = lang_map.get(target_lang, target_lang)
-                label = f"{target_lang.upper()} (Translated)"
-            else:
-                lang_code = 'und'  # undefined
-                label = "Subtitles"
-
+        for i, track in enumerate(tracks):
             cmd.extend([
-                f'-metadata:s:s:{subtitle_index}', f'language={lang_code}',
-                f'-metadata:s:s:{subtitle_index}', f'title={label}'
+                f'-metadata:s:s:{i}', f"language={track['language']}",
+                f'-metadata:s:s:{i}', f"title={track['title']}"
             ])
-            subtitle_index += 1
-
-            self.logger.info(f"  Track {subtitle_index}: {label} [{lang_code}]")
 
         # Create temp output with different name
-        temp_output = str(Path(output_path).with_suffix('.tmp.mp4'))
-        cmd.append(temp_output)
+        temp_output = Path(output_path).with_suffix('.tmp.mp4')
+        cmd.append(str(temp_output))
 
         # Execute FFmpeg
         try:
@@ -715,34 +940,79 @@ class VideoTranslationPipeline:
             )
 
             # Replace original with embedded version
-            import shutil
             shutil.move(temp_output, output_path)
 
             self.logger.info("✓ Subtitles embedded successfully")
             return True
 
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to embed subtitles: {e}")
-            self.logger.error(f"FFmpeg error: {e.stderr}")
+            self.logger.error("Failed to embed subtitles: %s", e)
+            self.logger.error("FFmpeg error: %s", e.stderr)
 
             # Clean up temp file if it exists
-            if Path(temp_output).exists():
-                Path(temp_output).unlink()
+            temp_output.unlink(missing_ok=True)
 
             return False
 
-    def _cleanup_temp_files(self) -> None:
+    def _link_or_copy(self, src: str, dst: str) -> None:
+        """
+        Hard-link src to dst, copying when linking is not possible
+
+        Output files are only ever replaced, never modified in place, so
+        sharing the inode with the input is safe.
+
+        Args:
+            src: Source file
+            dst: Destination path (replaced if it exists)
+        """
+        src_path = Path(src)
+        dst_path = Path(dst)
+
+        if dst_path.exists() and dst_path.samefile(src_path):
+            return
+
+        dst_path.unlink(missing_ok=True)
+        try:
+            os.link(src_path, dst_path)
+        except OSError:
+            # Cross-device, unsupported filesystem, etc.
+            shutil.copy2(src_path, dst_path)
+
+    def _cleanup_temp_files(self, temp_dir: Path) -> None:
         """
         Cleanup temporary files
+
+        Args:
+            temp_dir: Temp directory of a single run
         """
         try:
-            if self.temp_dir.exists():
-                for file in self.temp_dir.glob('*'):
-                    if file.is_file():
-                        file.unlink()
-                self.logger.info("Temporary files cleaned up")
+            shutil.rmtree(temp_dir)
+            self.logger.info("Temporary files cleaned up")
         except Exception as e:
-            self.logger.warning(f"Failed to cleanup temp files: {e}")
+            self.logger.warning("Failed to cleanup temp files: %s", e)
+
+    def close(self) -> None:
+        """
+        Release pipeline resources
+
+        Shuts down the text output thread pool and closes the translation
+        and TTS caches opened by this pipeline. The pipeline can't process
+        videos afterwards.
+        """
+        self._text_executor.shutdown(wait=True)
+
+        if isinstance(self.translator, CachedTranslator):
+            self.translator.cache.close()
+        if isinstance(self.tts_engine, CachedTTS):
+            self.tts_engine.cache.close()
+
+    def __enter__(self) -> 'VideoTranslationPipeline':
+        """Use pipeline as a context manager (closed on exit)"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close pipeline on context exit"""
+        self.close()
 
     def __repr__(self) -> str:
         """String representation"""
@@ -4,6 +4,8 @@ SpeechBridge Utilities Module
 
 Utility functions and classes:
 - logging: Rotating log system with archive
+- serialization: JSON decoding with optional orjson backend
+- audio: Audio file helpers (WAV header duration)
 - validation: Data validation utilities
 - helpers: Common helper functions
 """
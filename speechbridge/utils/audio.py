@@ -0,0 +1,94 @@
+"""
+SpeechBridge Audio Helpers
+==========================
+
+Lightweight audio file helpers that avoid spawning ffmpeg/ffprobe:
+- WAV duration from the file header
+- Speech start parsing for ffmpeg silencedetect output
+"""
+
+from typing import Iterable, Optional
+import re
+import wave
+
+
+# Speech start detection (ffmpeg silencedetect=noise=-30dB:d=0.5)
+SILENCE_THRESHOLD_DB = -30.0
+MIN_SILENCE_DURATION = 0.5
+SILENCEDETECT_FILTER = f'silencedetect=noise={SILENCE_THRESHOLD_DB}dB:d={MIN_SILENCE_DURATION}'
+
+# Silence boundaries in ffmpeg silencedetect output
+SILENCE_START_RE = re.compile(r'silence_start:\s*(-?[\d.]+)')
+SILENCE_END_RE = re.compile(r'silence_end:\s*([\d.]+)')
+
+# A silence counts as leading only if it starts this close to 0
+LEADING_SILENCE_TOLERANCE = 0.1
+
+
+def get_wav_duration(audio_path: str) -> Optional[float]:
+    """
+    Get duration of a WAV file from its header
+
+    Reads only the RIFF header, so it costs a file open instead of an
+    ffprobe process.
+
+    Args:
+        audio_path: Path to audio file
+
+    Returns:
+        Optional[float]: Duration in seconds, or None if the file is not
+        a readable PCM WAV (e.g. MP3 data with a .wav name)
+    """
+    try:
+        with wave.open(str(audio_path), 'rb') as audio:
+            return audio.getnframes() / float(audio.getframerate())
+    except (wave.Error, EOFError, OSError):
+        return None
+
+
+def parse_speech_start(ffmpeg_log: str) -> Optional[float]:
+    """
+    Get speech start time from ffmpeg silencedetect output
+
+    Args:
+        ffmpeg_log: ffmpeg stderr from a run with SILENCEDETECT_FILTER
+
+    Returns:
+        Optional[float]: End of the leading silence, or None if the audio
+        does not start with silence
+    """
+    return leading_silence_end(ffmpeg_log.splitlines())
+
+
+def leading_silence_end(lines: Iterable[str]) -> Optional[float]:
+    """
+    Get end of the leading silence from ffmpeg silencedetect output lines
+
+    Stops reading at the first silence_start, or at the silence_end that
+    closes it, so a streamed ffmpeg stderr is consumed only as far as
+    needed. Pauses later in the audio are not leading silence.
+
+    Args:
+        lines: ffmpeg stderr lines from a run with SILENCEDETECT_FILTER
+
+    Returns:
+        Optional[float]: Time of the silence_end paired with a
+        silence_start at about 0, or None if the audio does not start
+        with silence (or is silent throughout)
+    """
+    # "silence_start: 0" ... "silence_end: 8.14575 | silence_duration: 8.14575"
+    leading = False
+    for line in lines:
+        if not leading:
+            match = SILENCE_START_RE.search(line)
+            if match:
+                if float(match.group(1)) > LEADING_SILENCE_TOLERANCE:
+                    return None
+                leading = True
+            continue
+
+        match = SILENCE_END_RE.search(line)
+        if match:
+            return float(match.group(1))
+
+    return None
@@ -6,15 +6,43 @@ Rotating log system with overwrite on each run:
 - Current log: Overwrites on each run
 - Archive log: Appends all runs with timestamps
 - UTF-8 encoding for multilingual support
+- File/console writes happen on a background listener thread
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 
+# Active listener for the 'speechbridge' logger (one per process)
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _stop_listener() -> None:
+    """Write all queued records, stop the active listener and close its files"""
+    global _listener
+
+    with _listener_lock:
+        if _listener is None:
+            return
+
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+# Drain queued records on interpreter exit (registered once per process)
+atexit.register(_stop_listener)
+
+
 class SpeechBridgeLogger:
     """
     Rotating logger with current and archive logs
@@ -24,6 +52,8 @@ class SpeechBridgeLogger:
     - Archive log keeps history of all runs
     - UTF-8 encoding for Russian/multilingual text
     - Automatic directory creation
+    - Non-blocking: records are queued and written by a QueueListener,
+      so pipeline worker threads never wait on log file I/O
     """
 
     DEFAULT_FORMAT = '[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s'
@@ -65,7 +95,12 @@ class SpeechBridgeLogger:
         - Current log handler (mode='w' - overwrite)
         - Archive log handler (mode='a' - append)
         - Console handler (optional)
+
+        All three are driven by a QueueListener; the 'speechbridge'
+        logger itself only has a QueueHandler.
         """
+        global _listener
+
         # Create formatter
         formatter = logging.Formatter(
             self.DEFAULT_FORMAT,
@@ -76,6 +111,9 @@ class SpeechBridgeLogger:
         root_logger = logging.getLogger('speechbridge')
         root_logger.setLevel(self.log_level)
 
+        # Finish a previous setup first: its listener still holds the files
+        _stop_listener()
+
         # Remove existing handlers to avoid duplicates
         root_logger.handlers.clear()
 
@@ -87,7 +125,7 @@ class SpeechBridgeLogger:
         )
         current_handler.setLevel(self.log_level)
         current_handler.setFormatter(formatter)
-        root_logger.addHandler(current_handler)
+        handlers = [current_handler]
 
         # Archive log handler (append mode)
         archive_handler = logging.FileHandler(
@@ -97,14 +135,26 @@ class SpeechBridgeLogger:
         )
         archive_handler.setLevel(self.log_level)
         archive_handler.setFormatter(formatter)
-        root_logger.addHandler(archive_handler)
+        handlers.append(archive_handler)
 
         # Console handler (optional)
         if self.console_output:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(logging.INFO)  # Less verbose for console
             console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
+
+        # Loggers only enqueue records; the listener thread does the writes
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        with _listener_lock:
+            _listener = logging.handlers.QueueListener(
+                log_queue,
+                *handlers,
+                respect_handler_level=True
+            )
+            _listener.start()
 
         # Log session start in archive
         separator = "=" * 80
@@ -113,6 +163,29 @@ class SpeechBridgeLogger:
         root_logger.info(f"Log directory: {self.log_dir.absolute()}")
         root_logger.info(separator)
 
+    def stop(self) -> None:
+        """
+        Stop the background listener
+
+        Writes all queued records and closes the log files.
+        """
+        _stop_listener()
+
+    def flush(self) -> None:
+        """
+        Write all queued records to the log files
+
+        The listener is stopped (which drains the queue) and restarted.
+        """
+        with _listener_lock:
+            if _listener is None:
+                return
+
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.flush()
+            _listener.start()
+
     def get_logger(self, name: str = 'speechbridge') -> logging.Logger:
         """
         Get logger instance
@@ -153,6 +226,8 @@ class SpeechBridgeLogger:
         Returns:
             str: Log contents
         """
+        self.flush()
+
         if self.current_log.exists():
             return self.current_log.read_text(encoding='utf-8')
         return ""
@@ -167,6 +242,8 @@ class SpeechBridgeLogger:
         Returns:
             str: Log contents
         """
+        self.flush()
+
         if not self.archive_log.exists():
             return ""
 
@@ -0,0 +1,84 @@
+"""
+SpeechBridge JSON Serialization
+===============================
+
+Fast JSON encoding/decoding with optional orjson backend:
+- Uses orjson when installed (works on bytes directly, no text step)
+- Falls back to the standard library json module
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON document
+
+        Args:
+            data: JSON document as bytes or str
+
+        Returns:
+            Decoded Python object
+        """
+        return orjson.loads(data)
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """
+        Encode object as UTF-8 JSON (non-ASCII text kept as is)
+
+        Args:
+            obj: Object to encode (NumPy scalars/arrays are supported)
+            indent: Pretty-print with 2-space indentation
+
+        Returns:
+            bytes: JSON document
+        """
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    JSON_BACKEND = 'orjson'
+
+except ImportError:
+    import json
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """
+        Decode JSON document
+
+        Args:
+            data: JSON document as bytes or str
+
+        Returns:
+            Decoded Python object
+        """
+        return json.loads(data)
+
+    def _default(obj: Any) -> Any:
+        """Convert NumPy scalars/arrays to plain Python values"""
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """
+        Encode object as UTF-8 JSON (non-ASCII text kept as is)
+
+        Args:
+            obj: Object to encode (NumPy scalars/arrays are supported)
+            indent: Pretty-print with 2-space indentation
+
+        Returns:
+            bytes: JSON document
+        """
+        return json.dumps(
+            obj,
+            ensure_ascii=False,
+            indent=2 if indent else None,
+            default=_default
+        ).encode('utf-8')
+
+    JSON_BACKEND = 'json'
@@ -8,7 +8,9 @@ from pathlib import Path
 from flask import Flask, render_template, request, jsonify, send_file, session
 from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
 import threading
+import time
 import sys
 
 # Load environment variables from .env file
@@ -31,6 +33,19 @@ app.config['OUTPUT_FOLDER'].mkdir(exist_ok=True)
 
 # Store translation jobs
 translation_jobs = {}
+jobs_lock = threading.Lock()
+
+# Finished jobs (and their files) are dropped after JOB_TTL seconds,
+# or oldest first once more than MAX_JOBS are stored
+JOB_TTL = float(os.getenv('JOB_TTL', 24 * 3600))
+MAX_JOBS = int(os.getenv('MAX_JOBS', '1024'))
+
+# Video jobs saturate the CPU (Whisper, ffmpeg): run only a few at once,
+# further uploads wait in the executor queue with status 'queued'
+job_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('MAX_CONCURRENT_VIDEOS', '2')),
+    thread_name_prefix='translation-job'
+)
 
 ALLOWED_EXTENSIONS = {'mp4', 'mov', 'avi', 'mkv', 'webm', 'flv', 'wmv'}
 SUPPORTED_LANGUAGES = {
@@ -84,11 +99,43 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def prune_jobs():
+    """Drop expired finished jobs and delete their uploaded and output files"""
+    now = time.time()
+
+    with jobs_lock:
+        finished = sorted(
+            (job['created'], job_id)
+            for job_id, job in translation_jobs.items()
+            if job['status'] in ('completed', 'failed')
+        )
+        excess = len(translation_jobs) - MAX_JOBS
+
+        for i, (created, job_id) in enumerate(finished):
+            if i >= excess and now - created <= JOB_TTL:
+                continue
+
+            job = translation_jobs.pop(job_id)
+            Path(job['input_path']).unlink(missing_ok=True)
+
+            # Video plus subtitles/text exports named after it
+            output_stem = Path(job['output_file']).stem
+            for output in app.config['OUTPUT_FOLDER'].glob(f"{output_stem}*"):
+                output.unlink(missing_ok=True)
+
+
+def update_job(job_id, **fields):
+    """Update job fields under jobs_lock (no-op if the job was pruned)"""
+    with jobs_lock:
+        job = translation_jobs.get(job_id)
+        if job is not None:
+            job.update(fields)
+
+
 def translate_video_background(job_id, input_path, output_path, config):
     """Background task for video translation"""
     try:
-        translation_jobs[job_id]['status'] = 'processing'
-        translation_jobs[job_id]['progress'] = 'Initializing translation pipeline...'
+        update_job(job_id, status='processing', progress='Initializing translation pipeline...')
 
         # Build pipeline using PipelineBuilder
         deepl_api_key = os.getenv('DEEPL_API_KEY')
@@ -108,28 +155,27 @@ def translate_video_background(job_id, input_path, output_path, config):
         builder._pipeline_config['subtitle_only'] = config.subtitle_only
         builder._pipeline_config['subtitle_format'] = 'srt'
 
-        pipeline = builder.build()
-
-        # Run translation
-        translation_jobs[job_id]['progress'] = 'Transcribing video...'
-        result = pipeline.process_video(str(input_path), str(output_path))
+        # Run translation (closing the pipeline frees its worker threads)
+        with builder.build() as pipeline:
+            update_job(job_id, progress='Transcribing video...')
+            result = pipeline.process_video(str(input_path), str(output_path))
 
         if result['success']:
-            translation_jobs[job_id]['status'] = 'completed'
-            translation_jobs[job_id]['progress'] = 'Translation completed successfully!'
-            translation_jobs[job_id]['result'] = {
-                'output_file': output_path.name,
-                'message': 'Video translated successfully'
-            }
+            update_job(
+                job_id,
+                status='completed',
+                progress='Translation completed successfully!',
+                result={
+                    'output_file': output_path.name,
+                    'message': 'Video translated successfully'
+                }
+            )
         else:
-            translation_jobs[job_id]['status'] = 'failed'
-            translation_jobs[job_id]['progress'] = f"Error: {', '.join(result.get('errors', ['Unknown error']))}"
-            translation_jobs[job_id]['error'] = ', '.join(result.get('errors', ['Unknown error']))
+            error = ', '.join(result.get('errors', ['Unknown error']))
+            update_job(job_id, status='failed', progress=f"Error: {error}", error=error)
 
     except Exception as e:
-        translation_jobs[job_id]['status'] = 'failed'
-        translation_jobs[job_id]['progress'] = f'Error: {str(e)}'
-        translation_jobs[job_id]['error'] = str(e)
+        update_job(job_id, status='failed', progress=f'Error: {str(e)}', error=str(e))
 
 
 @app.route('/')
@@ -144,6 +190,8 @@ def index():
 def upload_file():
     """Handle file upload and start translation"""
     try:
+        prune_jobs()
+
         # Check if file is present
         if 'video' not in request.files:
             return jsonify({'error': 'No file uploaded'}), 400
@@ -186,11 +234,13 @@ def upload_file():
         )
 
         # Initialize job
-        translation_jobs[job_id] = {
+        job = {
             'status': 'queued',
             'progress': 'Upload completed, queued for processing...',
             'input_file': filename,
+            'input_path': str(input_path),
             'output_file': output_filename,
+            'created': time.time(),
             'config': {
                 'target_lang': target_lang,
                 'whisper_model': whisper_model,
@@ -200,14 +250,11 @@ def upload_file():
                 'subtitle_only': subtitle_only
             }
         }
+        with jobs_lock:
+            translation_jobs[job_id] = job
 
         # Start background translation
-        thread = threading.Thread(
-            target=translate_video_background,
-            args=(job_id, input_path, output_path, config)
-        )
-        thread.daemon = True
-        thread.start()
+        job_executor.submit(translate_video_background, job_id, input_path, output_path, config)
 
         return jsonify({
             'job_id': job_id,
@@ -222,10 +269,11 @@ def upload_file():
 @app.route('/status/<job_id>')
 def get_status(job_id):
     """Get translation job status"""
-    if job_id not in translation_jobs:
+    with jobs_lock:
+        job = dict(translation_jobs.get(job_id) or {})
+    if not job:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = translation_jobs[job_id]
     return jsonify({
         'status': job['status'],
         'progress': job['progress'],
@@ -237,10 +285,11 @@ def get_status(job_id):
 @app.route('/download/<job_id>')
 def download_file(job_id):
     """Download translated video"""
-    if job_id not in translation_jobs:
+    with jobs_lock:
+        job = dict(translation_jobs.get(job_id) or {})
+    if not job:
         return jsonify({'error': 'Job not found'}), 404
 
-    job = translation_jobs[job_id]
     if job['status'] != 'completed':
         return jsonify({'error': 'Translation not completed'}), 400
 
@@ -259,7 +308,9 @@ def download_file(job_id):
 def list_jobs():
     """List all translation jobs"""
     jobs = []
-    for job_id, job_data in translation_jobs.items():
+    with jobs_lock:
+        snapshot = list(translation_jobs.items())
+    for job_id, job_data in snapshot:
         jobs.append({
             'job_id': job_id,
             'status': job_data['status'],